@@ -1,11 +1,22 @@
 """
 Main Streamlit application entry point for Quiz Competition App
 """
+import html
+import textwrap
 import streamlit as st
-from database import init_db, SessionLocal
-from database.enums import UserRole
+from logging_config import configure_logging
+from database import ensure_schema, db_manager
+from database.streamlit_session import release_request_session, close_request_session
+from database.query_profiling import detect_n_plus_one
 from shared.styles import inject_custom_css, COLORS
 from shared.notifications import display_notifications
+from shared.auth_helpers import format_role_label, warm_up_password_hashing
+from shared.page_router import get_page_for_role
+
+# -----------------------------
+# Logging (once per process)
+# -----------------------------
+configure_logging()
 
 # -----------------------------
 # Streamlit page configuration
@@ -26,10 +37,12 @@ inject_custom_css()
 # Initialize database
 # -----------------------------
 try:
-    init_db()
+    ensure_schema()
 except Exception as e:
     st.error(f"Database initialization error: {e}")
 
+warm_up_password_hashing()
+
 # -----------------------------
 # Initialize session state
 # -----------------------------
@@ -39,6 +52,8 @@ if 'username' not in st.session_state:
     st.session_state.username = None
 if 'role' not in st.session_state:
     st.session_state.role = None
+if 'role_label' not in st.session_state:
+    st.session_state.role_label = format_role_label(st.session_state.role) if st.session_state.role else ''
 if 'authenticated' not in st.session_state:
     st.session_state.authenticated = False
 if 'current_page' not in st.session_state:
@@ -49,38 +64,43 @@ if 'current_page' not in st.session_state:
 # -----------------------------
 def logout():
     """Logout user and clear session"""
+    close_request_session()
+    db_manager.remove_session()
     # Clear all session state
-    for key in list(st.session_state.keys()):
-        del st.session_state[key]
+    st.session_state.clear()
     st.rerun()
 
 # -----------------------------
 # Top Navigation Bar
 # -----------------------------
-def render_top_nav():
-    """Render modern top navigation bar"""
-    # Navigation container
-    st.markdown(
-        f"""
-        <div class="top-nav">
-            <div style="display: flex; align-items: center; justify-content: space-between;">
-                <div style="font-size: 1.5rem; font-weight: 700; color: {COLORS['primary']}; display: flex; align-items: center;">
-                    <span style="margin-right: 0.5rem;">🏆</span>
-                    Quiz Competition
-                </div>
-                <div style="display: flex; align-items: center; gap: 1rem;">
-                    <span style="color: {COLORS['text_secondary']}; font-weight: 500;">
-                        {st.session_state.username}
-                    </span>
-                    <span style="padding: 0.25rem 0.75rem; background: {COLORS['primary_light']}; color: {COLORS['primary']}; border-radius: 9999px; font-size: 0.75rem; font-weight: 600;">
-                        {st.session_state.role.value.upper() if st.session_state.role else ''}
-                    </span>
-                </div>
+# Static markup (including COLORS lookups) is formatted once at import;
+# each rerun only substitutes the username and role label.
+_TOP_NAV_TEMPLATE = textwrap.dedent(f"""
+    <div class="top-nav">
+        <div style="display: flex; align-items: center; justify-content: space-between;">
+            <div style="font-size: 1.5rem; font-weight: 700; color: {COLORS['primary']}; display: flex; align-items: center;">
+                <span style="margin-right: 0.5rem;">🏆</span>
+                Quiz Competition
+            </div>
+            <div style="display: flex; align-items: center; gap: 1rem;">
+                <span style="color: {COLORS['text_secondary']}; font-weight: 500;">
+                    {{username}}
+                </span>
+                <span style="padding: 0.25rem 0.75rem; background: {COLORS['primary_light']}; color: {COLORS['primary']}; border-radius: 9999px; font-size: 0.75rem; font-weight: 600;">
+                    {{role_label}}
+                </span>
             </div>
         </div>
-        """,
-        unsafe_allow_html=True
-    )
+    </div>
+""").strip()
+
+
+def render_top_nav():
+    """Render modern top navigation bar"""
+    st.html(_TOP_NAV_TEMPLATE.format(
+        username=html.escape(st.session_state.username or ''),
+        role_label=st.session_state.role_label
+    ))
 
 # -----------------------------
 # Main Application Logic
@@ -100,14 +120,9 @@ def main():
     render_top_nav()
     
     # Render page based on user role
-    if st.session_state.role == UserRole.INSTRUCTOR:
-        from pages.instructor_dashboard import show_instructor_dashboard
-        show_instructor_dashboard()
-    
-    elif st.session_state.role == UserRole.STUDENT:
-        from pages.student_dashboard import show_student_dashboard
-        show_student_dashboard()
-    
+    show_page = get_page_for_role(st.session_state.role)
+    if show_page:
+        show_page()
     else:
         st.error("Invalid user role")
         logout()
@@ -122,4 +137,10 @@ def main():
 # Entry Point
 # -----------------------------
 if __name__ == "__main__":
-    main()
+    try:
+        with detect_n_plus_one():
+            main()
+    finally:
+        # Hand the pooled connection back between reruns
+        release_request_session()
+        db_manager.remove_session()
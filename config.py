@@ -17,9 +17,42 @@ DB_PASSWORD = os.getenv('DB_PASSWORD', 'quizpass')
 # SQLAlchemy Database URL
 DATABASE_URL = f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
 
+# Optional read replica for SELECT-only queries (defaults to the primary)
+READ_DATABASE_URL = os.getenv('READ_DATABASE_URL') or DATABASE_URL
+
+# Optional Redis cache for hot aggregate counts (disabled when unset)
+REDIS_URL = os.getenv('REDIS_URL')
+COUNT_CACHE_TTL = 30  # seconds
+LEADERBOARD_CACHE_TTL = 60  # seconds
+SESSION_CODE_CACHE_TTL = 5  # seconds
+
+# Connection Pool Configuration
+# pool_size ≈ expected concurrent users × sessions opened per rerun
+DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', '20'))
+DB_MAX_OVERFLOW = int(os.getenv('DB_MAX_OVERFLOW', '40'))
+DB_POOL_TIMEOUT = int(os.getenv('DB_POOL_TIMEOUT', '10'))  # seconds to wait for a free connection
+# Keep below the server/proxy idle timeout so stale connections are replaced before use
+DB_POOL_RECYCLE = int(os.getenv('DB_POOL_RECYCLE', '1800'))  # seconds
+# Ping connections on checkout; enable where the database restarts or drops idle connections
+DB_POOL_PRE_PING = os.getenv('DB_POOL_PRE_PING', 'false').lower() in ('1', 'true', 'yes')
+
+# Development: log N+1 lazy loads per script run (pip install nplusone)
+DETECT_N_PLUS_ONE = os.getenv('DETECT_N_PLUS_ONE', 'false').lower() in ('1', 'true', 'yes')
+
+# Development: record @performance_monitor timings (slow calls plus 1 in N others)
+PERF_MONITOR_ENABLED = os.getenv('PERF_MONITOR', 'false').lower() in ('1', 'true', 'yes')
+PERF_MONITOR_SAMPLE_RATE = int(os.getenv('PERF_MONITOR_SAMPLE_RATE', '100'))
+
+# Security Configuration
+# bcrypt cost for new hashes; existing hashes keep the cost they were created with
+BCRYPT_ROUNDS = int(os.getenv('BCRYPT_ROUNDS', '12'))
+# SHA-256 the password before bcrypt so nothing past bcrypt's 72-byte limit is ignored
+BCRYPT_PREHASH = os.getenv('BCRYPT_PREHASH', 'true').lower() in ('1', 'true', 'yes')
+
 # App Configuration
 BASE_POINTS = 1000
 SPEED_PENALTY_MULTIPLIER = 0.3
+MAX_SPEED_PENALTY = BASE_POINTS * SPEED_PENALTY_MULTIPLIER  # points lost for using the full time limit
 DEFAULT_QUESTION_TIME = 30  # seconds
 SESSION_CODE_LENGTH = 5
 
@@ -31,6 +64,7 @@ AUTO_REFRESH_RESULTS = 10  # seconds - for results page
 NOTIFICATION_DURATION = 3  # seconds
 ACTIVITY_FEED_MAX_ITEMS = 20  # maximum activities to keep
 STUDENTS_PER_PAGE = 50  # pagination for student list
+QUIZZES_PER_PAGE = 50  # pagination for instructor quiz list
 
 
 
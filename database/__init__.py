@@ -2,6 +2,9 @@
 Database package initialization
 Centralized database connection and model management
 """
+from datetime import datetime, timezone
+import streamlit as st
+from sqlalchemy import text, DateTime
 from sqlalchemy.orm import declarative_base
 
 # Import centralized connection management
@@ -17,6 +20,11 @@ from database.connection import (
 # ----------------------------------------
 Base = declarative_base()
 
+
+def utc_now() -> datetime:
+    """Current time as a timezone-aware UTC datetime"""
+    return datetime.now(timezone.utc)
+
 # ----------------------------------------
 # Legacy exports for backward compatibility
 # ----------------------------------------
@@ -28,6 +36,85 @@ SessionLocal = db_manager.SessionLocal
 # ----------------------------------------
 # Database initialization
 # ----------------------------------------
+# Enum columns once stored as native Postgres ENUM types (by member name),
+# now plain VARCHAR holding the member value: (table, column, old type)
+_VARCHAR_ENUM_COLUMNS = [
+    ("users", "role", "userrole"),
+    ("quiz_sessions", "status", "sessionstatus"),
+]
+
+
+def _migrate_enum_columns(conn):
+    """Convert legacy native ENUM columns to VARCHAR values (idempotent)"""
+    for table_name, column_name, type_name in _VARCHAR_ENUM_COLUMNS:
+        data_type = conn.execute(
+            text(
+                "SELECT data_type FROM information_schema.columns "
+                "WHERE table_name = :table AND column_name = :column"
+            ),
+            {"table": table_name, "column": column_name}
+        ).scalar()
+        if data_type == "USER-DEFINED":
+            conn.execute(text(
+                f'ALTER TABLE "{table_name}" ALTER COLUMN "{column_name}" '
+                f'TYPE VARCHAR(20) USING lower("{column_name}"::text)'
+            ))
+            conn.execute(text(f'DROP TYPE IF EXISTS "{type_name}"'))
+
+
+def _migrate_timestamp_columns(conn):
+    """Convert legacy naive-UTC timestamp columns to timestamptz (idempotent)"""
+    aware_columns = {
+        (table.name, column.name)
+        for table in Base.metadata.sorted_tables
+        for column in table.columns
+        if isinstance(column.type, DateTime) and column.type.timezone
+    }
+    naive_columns = conn.execute(text(
+        "SELECT table_name, column_name FROM information_schema.columns "
+        "WHERE table_schema = 'public' AND data_type = 'timestamp without time zone'"
+    )).all()
+    for table_name, column_name in naive_columns:
+        if (table_name, column_name) in aware_columns:
+            conn.execute(text(
+                f'ALTER TABLE "{table_name}" ALTER COLUMN "{column_name}" '
+                f'TYPE TIMESTAMP WITH TIME ZONE USING "{column_name}" AT TIME ZONE \'UTC\''
+            ))
+
+
+def _migrate_added_columns(conn):
+    """
+    Add model columns missing from existing tables (idempotent)
+
+    Returns:
+        Set of (table, column) pairs that were added
+    """
+    added = set()
+    for table in Base.metadata.sorted_tables:
+        existing = set(conn.execute(
+            text(
+                "SELECT column_name FROM information_schema.columns "
+                "WHERE table_schema = 'public' AND table_name = :table"
+            ),
+            {"table": table.name}
+        ).scalars())
+        for column in table.columns:
+            if column.name in existing:
+                continue
+            ddl = f'ALTER TABLE "{table.name}" ADD COLUMN "{column.name}" {column.type.compile(dialect=conn.dialect)}'
+            if column.server_default is not None:
+                default_sql = column.server_default.arg.compile(
+                    dialect=conn.dialect,
+                    compile_kwargs={"literal_binds": True}
+                )
+                ddl += f" DEFAULT {default_sql}"
+            if not column.nullable:
+                ddl += " NOT NULL"
+            conn.execute(text(ddl))
+            added.add((table.name, column.name))
+    return added
+
+
 def init_db():
     """
     Initialize the database by creating all tables.
@@ -35,18 +122,54 @@ def init_db():
     so SQLAlchemy knows about them.
     """
     # Import models here so they are registered properly
-    from database.models import (
-        User,
-        Quiz,
-        Question,
-        QuestionOption,
-        QuizSession,
-        SessionParticipant,
-        StudentAnswer
-    )
+    from database.models import register_models
+    register_models()
+
+    with db_manager.engine.begin() as conn:
+        # gen_random_uuid() backs every primary key's server default
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS pgcrypto"))
+        # gin_trgm_ops backs the substring search indexes on users
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+
+        # Use centralized database manager
+        Base.metadata.create_all(bind=conn)
+        added_columns = _migrate_added_columns(conn)
+        _migrate_enum_columns(conn)
+        _migrate_timestamp_columns(conn)
 
-    # Use centralized database manager
-    Base.metadata.create_all(bind=db_manager.engine)
+        if ("session_participants", "total_points") in added_columns:
+            # Import here to avoid circular dependency
+            from features.scoring.scoring_data_access import participant_score_update
+            # Backfill denormalized scores for sessions played before the columns existed
+            conn.execute(participant_score_update())
+
+        # create_all() does not alter existing tables; make sure tables
+        # created before values were generated server-side get the defaults
+        # and indexes too
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(conn, checkfirst=True)
+            for column in table.columns:
+                if column.server_default is None:
+                    continue
+                default_sql = column.server_default.arg.compile(
+                    dialect=conn.dialect,
+                    compile_kwargs={"literal_binds": True}
+                )
+                conn.execute(text(
+                    f'ALTER TABLE "{table.name}" ALTER COLUMN "{column.name}" SET DEFAULT {default_sql}'
+                ))
+
+
+@st.cache_resource(show_spinner=False)
+def ensure_schema() -> bool:
+    """
+    Run init_db() at most once per server process.
+    Later reruns and sessions skip the create_all metadata round-trips;
+    a failed attempt is not cached and is retried on the next run.
+    """
+    init_db()
+    return True
 
 
 # ----------------------------------------
@@ -58,6 +181,8 @@ __all__ = [
     'get_db',
     'get_db_context',
     'init_db',
+    'utc_now',
+    'ensure_schema',
     'engine',
     'SessionLocal',
     'DatabaseManager'
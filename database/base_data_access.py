@@ -3,7 +3,7 @@ Base Data Access Layer
 Provides common database operations for all feature-specific data access classes
 """
 from sqlalchemy.orm import Session
-from typing import Any, TypeVar, Generic
+from typing import Any, TypeVar, Generic, Optional
 
 T = TypeVar('T')
 
@@ -15,14 +15,18 @@ class BaseDataAccess(Generic[T]):
     and reduce code duplication across feature modules.
     """
 
-    def __init__(self, db_session: Session):
+    def __init__(self, db_session: Session, read_session: Optional[Session] = None):
         """
         Initialize data access with database session
 
         Args:
-            db_session: SQLAlchemy database session
+            db_session: SQLAlchemy database session, created from
+                get_sessionmaker() so it draws on the shared connection pool
+            read_session: Optional session for SELECT-only queries
+                (defaults to db_session)
         """
         self.db = db_session
+        self.read_db = read_session or db_session
 
     # ==================== Core Database Operations ====================
 
@@ -39,6 +43,23 @@ class BaseDataAccess(Generic[T]):
         self.db.add(model)
         return model
 
+    def save(self, model: T) -> T:
+        """
+        Add a model instance and write it to the database
+
+        The INSERT's RETURNING fills in the primary key, so no refresh is
+        needed; other server-generated columns load on first access.
+
+        Args:
+            model: SQLAlchemy model instance
+
+        Returns:
+            The same model instance
+        """
+        self.db.add(model)
+        self.db.commit()
+        return model
+
     def flush(self) -> None:
         """
         Flush pending changes to the database without committing
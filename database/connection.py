@@ -1,51 +1,144 @@
 """
 Database Connection Management
-Centralized singleton for database connection and session management
+Centralized, Streamlit-cached database connection and session management
 """
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
+import streamlit as st
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import sessionmaker, scoped_session, Session
 from contextlib import contextmanager
 from typing import Generator
 import config
+from logging_config import get_logger
+
+logger = get_logger("database")
+
+
+@st.cache_resource(show_spinner=False)
+def get_engine() -> Engine:
+    """
+    Get the process-wide SQLAlchemy engine.
+    Streamlit owns its lifetime so every session and rerun shares one pool.
+    
+    Returns:
+        Engine: Pooled SQLAlchemy engine
+    """
+    engine = create_engine(
+        config.DATABASE_URL,
+        # Off by default (no per-checkout SELECT 1): stale connections are
+        # recycled before the server idle timeout, and SQLAlchemy invalidates
+        # the whole pool on the first disconnect error so later checkouts
+        # reconnect lazily. Enable where database restarts must be invisible.
+        pool_pre_ping=config.DB_POOL_PRE_PING,
+        pool_size=config.DB_POOL_SIZE,          # Number of connections to maintain
+        max_overflow=config.DB_MAX_OVERFLOW,    # Max additional connections
+        pool_timeout=config.DB_POOL_TIMEOUT,    # Seconds to wait for a connection
+        pool_recycle=config.DB_POOL_RECYCLE,    # Seconds before a connection is replaced
+        pool_use_lifo=True,      # Reuse the most recent connection so a small hot set stays warm
+        echo=False               # Set to True for SQL debugging
+    )
+    
+    @event.listens_for(engine, "checkout")
+    def _warn_on_saturation(dbapi_connection, connection_record, connection_proxy):
+        """Log when every pooled and overflow connection is checked out"""
+        if engine.pool.checkedout() >= config.DB_POOL_SIZE + config.DB_MAX_OVERFLOW:
+            logger.warning("Database connection pool saturated: %s", engine.pool.status())
+    
+    return engine
+
+
+@st.cache_resource(show_spinner=False)
+def get_sessionmaker() -> sessionmaker:
+    """
+    Get the session factory bound to the shared engine.
+    
+    Returns:
+        sessionmaker: SQLAlchemy session factory
+    """
+    return sessionmaker(
+        autocommit=False,
+        autoflush=False,
+        # Objects stay usable after commit without a reload; the rollback at
+        # the end of every rerun (release_request_session) still expires them
+        expire_on_commit=False,
+        bind=get_engine()
+    )
+
+
+@st.cache_resource(show_spinner=False)
+def get_read_engine() -> Engine:
+    """
+    Get the engine used for read-only queries.
+    Points at READ_DATABASE_URL (a replica, or the primary by default) and
+    runs in AUTOCOMMIT so plain SELECTs skip the BEGIN/COMMIT round-trips.
+    
+    Returns:
+        Engine: Pooled SQLAlchemy engine for reads
+    """
+    return create_engine(
+        config.READ_DATABASE_URL,
+        isolation_level="AUTOCOMMIT",
+        pool_pre_ping=config.DB_POOL_PRE_PING,
+        pool_size=config.DB_POOL_SIZE,
+        max_overflow=config.DB_MAX_OVERFLOW,
+        pool_timeout=config.DB_POOL_TIMEOUT,
+        pool_recycle=config.DB_POOL_RECYCLE,
+        pool_use_lifo=True,
+        echo=False
+    )
+
+
+@st.cache_resource(show_spinner=False)
+def get_read_sessionmaker() -> sessionmaker:
+    """
+    Get the session factory bound to the read engine.
+    
+    Returns:
+        sessionmaker: SQLAlchemy session factory for reads
+    """
+    return sessionmaker(
+        autoflush=False,
+        bind=get_read_engine()
+    )
+
+
+@st.cache_resource(show_spinner=False)
+def get_scoped_session() -> scoped_session:
+    """
+    Get the thread-local session registry.
+    Each Streamlit script thread gets its own session from SessionLocal().
+    
+    Returns:
+        scoped_session: Thread-local SQLAlchemy session registry
+    """
+    return scoped_session(get_sessionmaker())
 
 
 class DatabaseManager:
     """
-    Singleton database manager for centralized connection handling.
-    Ensures efficient connection pooling and proper resource management.
+    Database manager for centralized connection handling.
+    Delegates engine and session factory to Streamlit-cached resources.
     """
-    _instance = None
     
-    def __new__(cls):
-        """Implement singleton pattern"""
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._initialized = False
-        return cls._instance
+    @property
+    def engine(self) -> Engine:
+        """Shared SQLAlchemy engine"""
+        return get_engine()
     
-    def __init__(self):
-        """Initialize database engine and session factory"""
-        if self._initialized:
-            return
-        
-        # Create engine with connection pooling
-        self.engine = create_engine(
-            config.DATABASE_URL,
-            pool_pre_ping=True,      # Verify connections before using
-            pool_size=10,            # Number of connections to maintain
-            max_overflow=20,         # Max additional connections
-            pool_recycle=3600,       # Recycle connections after 1 hour
-            echo=False               # Set to True for SQL debugging
-        )
-        
-        # Create session factory
-        self.SessionLocal = sessionmaker(
-            autocommit=False,
-            autoflush=False,
-            bind=self.engine
-        )
-        
-        self._initialized = True
+    @property
+    def SessionLocal(self) -> scoped_session:
+        """Thread-local session registry"""
+        return get_scoped_session()
+    
+    @property
+    def read_engine(self) -> Engine:
+        """Shared read-only SQLAlchemy engine"""
+        return get_read_engine()
+    
+    @property
+    def ReadSessionLocal(self) -> sessionmaker:
+        """Session factory for read-only queries"""
+        return get_read_sessionmaker()
     
     @contextmanager
     def get_session(self) -> Generator[Session, None, None]:
@@ -59,7 +152,7 @@ class DatabaseManager:
         
         The session will automatically commit on success or rollback on error.
         """
-        session = self.SessionLocal()
+        session = get_sessionmaker()()
         try:
             yield session
             session.commit()
@@ -84,10 +177,13 @@ class DatabaseManager:
         """
         return self.SessionLocal()
     
+    def remove_session(self) -> None:
+        """Close and discard the current thread's scoped session"""
+        self.SessionLocal.remove()
+    
     def dispose(self):
         """Dispose of the connection pool (useful for testing)"""
-        if hasattr(self, 'engine'):
-            self.engine.dispose()
+        self.engine.dispose()
 
 
 # Global database manager instance
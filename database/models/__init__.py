@@ -1,20 +1,42 @@
+import importlib
+
 from sqlalchemy.ext.declarative import declarative_base
 
 # Base model for all ORM models
 Base = declarative_base()
 
-# Import all models so Alembic and SQLAlchemy can discover them
-from .user import User
-from .quiz import Quiz
-from .question import Question
-from .question_option import QuestionOption
-from .quiz_session import QuizSession
-from .session_participiant import SessionParticipant
-from .student_ansawer import StudentAnswer
-
 # Import enums or shared constants (if defined here)
 from database.enums import UserRole, SessionStatus
 
+# Model modules are imported lazily (PEP 562) so that importing the
+# package does not load the whole ORM graph; init_db() registers them all.
+_MODEL_MODULES = {
+    "User": ".user",
+    "Quiz": ".quiz",
+    "Question": ".question",
+    "QuestionOption": ".question_option",
+    "QuizSession": ".quiz_session",
+    "SessionParticipant": ".session_participiant",
+    "StudentAnswer": ".student_ansawer",
+}
+
+
+def __getattr__(name):
+    """Import a model module on first attribute access"""
+    module_name = _MODEL_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    model = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = model
+    return model
+
+
+def register_models():
+    """Import every model so SQLAlchemy and Alembic can discover them"""
+    for name in _MODEL_MODULES:
+        __getattr__(name)
+
+
 __all__ = [
     "Base",
     "User",
@@ -26,4 +48,5 @@ __all__ = [
     "StudentAnswer",
     "UserRole",
     "SessionStatus",
+    "register_models",
 ]
@@ -1,22 +1,23 @@
 
-from datetime import datetime
-from sqlalchemy import Column, Integer, DateTime, ForeignKey, Text, Enum
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, Text, Enum, Index, text, func
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID
-import uuid
 import enum
 from database import Base
 
 class Question(Base):
     """Question model"""
     __tablename__ = "questions"
+    __table_args__ = (
+        Index("ix_questions_quiz_order", "quiz_id", "question_order"),
+    )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"), index=True)
     quiz_id = Column(UUID(as_uuid=True), ForeignKey("quizzes.id", ondelete="CASCADE"), nullable=False)
     question_text = Column(Text, nullable=False)
     question_order = Column(Integer, nullable=False)
     time_limit = Column(Integer, default=30)  # seconds
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     # Relationships
     quiz = relationship("Quiz", back_populates="questions")
@@ -1,16 +1,18 @@
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Text, Enum
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Text, Enum, Index, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID
-import uuid
 
 from database import Base
 class QuestionOption(Base):
 
     """Question option model"""
     __tablename__ = "question_options"
+    __table_args__ = (
+        Index("ix_options_question_order", "question_id", "option_order"),
+    )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"), index=True)
     question_id = Column(UUID(as_uuid=True), ForeignKey("questions.id", ondelete="CASCADE"), nullable=False)
     option_text = Column(String(500), nullable=False)
     option_order = Column(Integer, nullable=False)  # A=1, B=2, C=3, D=4
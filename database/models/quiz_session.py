@@ -1,24 +1,32 @@
 
-from datetime import datetime
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Text, Enum
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Text, Enum, Index, text, func
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID
-import uuid
 from database.enums import SessionStatus
 from database import Base
 class QuizSession(Base):
     """Quiz session model"""
     __tablename__ = "quiz_sessions"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"), index=True)
     quiz_id = Column(UUID(as_uuid=True), ForeignKey("quizzes.id", ondelete="CASCADE"), nullable=False)
     instructor_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     session_code = Column(String(10), unique=True, nullable=False, index=True)
-    status = Column(Enum(SessionStatus), default=SessionStatus.PENDING, nullable=False)
+    status = Column(
+        Enum(SessionStatus, native_enum=False, length=20, values_callable=lambda e: [m.value for m in e]),
+        default=SessionStatus.PENDING,
+        nullable=False
+    )
     current_question_id = Column(UUID(as_uuid=True), ForeignKey("questions.id"), nullable=True)
-    start_time = Column(DateTime, nullable=True)
-    end_time = Column(DateTime, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    current_question_index = Column(Integer, nullable=True)  # position of current_question_id in quiz order
+    start_time = Column(DateTime(timezone=True), nullable=True)
+    end_time = Column(DateTime(timezone=True), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        Index("ix_quiz_sessions_instructor_status", instructor_id, status),
+        Index("ix_quiz_sessions_instructor_created_at", instructor_id, created_at.desc()),
+    )
 
     # Relationships
     quiz = relationship("Quiz", back_populates="sessions")
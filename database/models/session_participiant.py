@@ -1,19 +1,27 @@
-from datetime import datetime
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Text, Enum
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Text, Enum, Index, text, func
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID
-import uuid
 
 from database import Base
 
 class SessionParticipant(Base):
     """Session participant model - tracks which students joined which sessions"""
     __tablename__ = "session_participants"
+    __table_args__ = (
+        Index("ix_session_participants_session_points", "session_id", "total_points"),
+        # Also covers student_id for index-only scans of per-session student lookups/counts
+        Index("uq_session_participants_session_student", "session_id", "student_id", unique=True),
+    )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"), index=True)
     session_id = Column(UUID(as_uuid=True), ForeignKey("quiz_sessions.id", ondelete="CASCADE"), nullable=False)
     student_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
-    joined_at = Column(DateTime, default=datetime.utcnow)
+    joined_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    # Denormalized score totals, kept in sync on every answer write
+    total_points = Column(Integer, nullable=False, default=0, server_default=text("0"))
+    correct_count = Column(Integer, nullable=False, default=0, server_default=text("0"))
+    answered_count = Column(Integer, nullable=False, default=0, server_default=text("0"))
 
     # Relationships
     session = relationship("QuizSession", back_populates="participants")
@@ -1,19 +1,23 @@
-from datetime import datetime
-from sqlalchemy import Column, Integer, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, Index, text, func
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID
-import uuid
 from database import Base
 class StudentAnswer(Base):
     """Student answer model - tracks all answers submitted"""
     __tablename__ = "student_answers"
+    __table_args__ = (
+        Index("ix_student_answers_session_question", "session_id", "question_id"),
+        # One answer per student per question; target of the submit_answer upsert
+        Index("uq_student_answers_session_student_question",
+              "session_id", "student_id", "question_id", unique=True),
+    )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"), index=True)
     session_id = Column(UUID(as_uuid=True), ForeignKey("quiz_sessions.id", ondelete="CASCADE"), nullable=False)
     student_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     question_id = Column(UUID(as_uuid=True), ForeignKey("questions.id", ondelete="CASCADE"), nullable=False)
     option_id = Column(UUID(as_uuid=True), ForeignKey("question_options.id", ondelete="SET NULL"), nullable=True)
-    submitted_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    submitted_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
 
     # Relationships
     session = relationship("QuizSession", back_populates="student_answers")
@@ -1,9 +1,7 @@
 
-from datetime import datetime
-from sqlalchemy import Column, String, DateTime, Enum
+from sqlalchemy import Column, String, DateTime, Enum, Index, text, func
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID
-import uuid
 
 from database.enums import UserRole
 from database import Base
@@ -11,13 +9,27 @@ from database import Base
 class User(Base):
     """User model for both instructors and students"""
     __tablename__ = "users"
+    __table_args__ = (
+        # Trigram indexes let ILIKE '%term%' student searches use an index scan
+        Index("ix_users_username_trgm", "username",
+              postgresql_using="gin", postgresql_ops={"username": "gin_trgm_ops"}),
+        Index("ix_users_email_trgm", "email",
+              postgresql_using="gin", postgresql_ops={"email": "gin_trgm_ops"}),
+        # Keyset pagination of the student list seeks on (username, id)
+        Index("ix_users_student_username_id", "username", "id",
+              postgresql_where=text("role = 'student'")),
+    )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"), index=True)
     username = Column(String(100), unique=True, nullable=False, index=True)
     email = Column(String(255), unique=True, nullable=False, index=True)
     password_hash = Column(String(255), nullable=False)
-    role = Column(Enum(UserRole), nullable=False, default=UserRole.STUDENT)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    role = Column(
+        Enum(UserRole, native_enum=False, length=20, values_callable=lambda e: [m.value for m in e]),
+        nullable=False,
+        default=UserRole.STUDENT
+    )
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     # Relationships
     created_quizzes = relationship("Quiz", back_populates="instructor", cascade="all, delete-orphan")
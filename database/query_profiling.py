@@ -0,0 +1,44 @@
+"""
+Development Query Profiling
+Logs N+1 lazy loads and unused eager loads per script run (needs the optional nplusone package)
+"""
+import contextlib
+from config import DETECT_N_PLUS_ONE
+from logging_config import get_logger
+
+logger = get_logger("nplusone")
+
+try:
+    # Importing the extension patches SQLAlchemy's loaders to emit signals
+    import nplusone.ext.sqlalchemy  # noqa: F401
+    from nplusone.core.profiler import Profiler
+except ImportError:
+    Profiler = None
+
+
+@contextlib.contextmanager
+def detect_n_plus_one():
+    """
+    Log N+1 queries raised while the block runs (no-op unless DETECT_N_PLUS_ONE is set)
+
+    nplusone's listeners are process-wide, so reports are only meaningful
+    with a single active user, i.e. in development.
+    """
+    if not DETECT_N_PLUS_ONE:
+        yield
+        return
+
+    if Profiler is None:
+        logger.warning("DETECT_N_PLUS_ONE is set but nplusone is not installed")
+        yield
+        return
+
+    class LoggingProfiler(Profiler):
+        """Profiler that logs findings instead of raising NPlusOneError"""
+
+        def notify(self, message):
+            if not message.match(self.whitelist):
+                logger.warning(message.message)
+
+    with LoggingProfiler():
+        yield
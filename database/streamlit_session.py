@@ -0,0 +1,87 @@
+"""
+Streamlit Session-Scoped Database Session
+One SQLAlchemy session per browser session, reused across reruns
+"""
+from typing import Any, Callable
+import streamlit as st
+from sqlalchemy.orm import Session
+from database.connection import get_sessionmaker, get_read_sessionmaker
+
+_SESSION_KEY = "_db"
+_READ_SESSION_KEY = "_read_db"
+_SCOPED_KEY = "_db_scoped"
+
+
+def get_request_session() -> Session:
+    """
+    Get the database session bound to the current Streamlit session.
+
+    Streamlit serializes script runs per browser session, so the session
+    is never shared between threads.
+
+    Returns:
+        Session: SQLAlchemy database session
+    """
+    if _SESSION_KEY not in st.session_state:
+        # A dedicated session, not the thread-local one: Streamlit may run
+        # another browser session's script on this thread later
+        st.session_state[_SESSION_KEY] = get_sessionmaker()()
+    return st.session_state[_SESSION_KEY]
+
+
+def get_request_read_session() -> Session:
+    """
+    Get the read-only database session bound to the current Streamlit session.
+
+    Only use it for results that are not modified and committed afterwards;
+    writes must go through get_request_session().
+
+    Returns:
+        Session: SQLAlchemy session on the read engine
+    """
+    if _READ_SESSION_KEY not in st.session_state:
+        st.session_state[_READ_SESSION_KEY] = get_read_sessionmaker()()
+    return st.session_state[_READ_SESSION_KEY]
+
+
+def get_request_scoped(name: str, factory: Callable[[], Any]) -> Any:
+    """
+    Build an object bound to the request sessions once per browser session.
+    
+    Used for service bundles so reruns do not rebuild them; they are
+    discarded together with the sessions they hold.
+    
+    Args:
+        name: Cache slot name
+        factory: Builds the object on first use
+        
+    Returns:
+        The cached object
+    """
+    scoped = st.session_state.setdefault(_SCOPED_KEY, {})
+    if name not in scoped:
+        scoped[name] = factory()
+    return scoped[name]
+
+
+def release_request_session() -> None:
+    """
+    End the current transaction at the end of a script run.
+
+    Returns the pooled connection so idle browser tabs do not hold it
+    between reruns, and expires loaded objects so the next rerun reads
+    fresh data. The session object itself is kept for reuse.
+    """
+    for key in (_SESSION_KEY, _READ_SESSION_KEY):
+        session = st.session_state.get(key)
+        if session is not None:
+            session.rollback()
+
+
+def close_request_session() -> None:
+    """Close and discard the sessions and objects bound to them (call on logout)"""
+    st.session_state.pop(_SCOPED_KEY, None)
+    for key in (_SESSION_KEY, _READ_SESSION_KEY):
+        session = st.session_state.pop(key, None)
+        if session is not None:
+            session.close()
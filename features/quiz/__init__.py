@@ -2,9 +2,24 @@
 Quiz Feature Module
 Business logic and data access for quiz and question management
 """
-from .quiz_service import QuizService
-from .quiz_data_access import QuizDataAccess
-from .question_data_access import QuestionDataAccess
+import importlib
 
-__all__ = ['QuizService', 'QuizDataAccess', 'QuestionDataAccess']
+# Submodules are imported lazily (PEP 562) on first attribute access
+_EXPORTS = {
+    'QuizService': '.quiz_service',
+    'QuizDataAccess': '.quiz_data_access',
+    'QuestionDataAccess': '.question_data_access',
+}
+
+
+def __getattr__(name):
+    """Import the submodule providing ``name`` on first access"""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
 
+
+__all__ = ['QuizService', 'QuizDataAccess', 'QuestionDataAccess']
@@ -0,0 +1,65 @@
+"""
+Cached Question Reads
+Read-only question/option lookups cached across Streamlit reruns
+"""
+from typing import List, Dict, Any
+import streamlit as st
+from config import AUTO_REFRESH_ACTIVE_SESSION
+from database.connection import db_manager
+from .question_data_access import QuestionDataAccess
+
+
+@st.cache_data(ttl=AUTO_REFRESH_ACTIVE_SESSION, show_spinner=False)
+def cached_questions_by_quiz(quiz_id: Any) -> List[Dict[str, Any]]:
+    """
+    Get all questions for a quiz as plain dictionaries
+
+    Args:
+        quiz_id: Quiz ID
+
+    Returns:
+        List of question dicts ordered by question_order
+    """
+    with db_manager.get_session() as db:
+        questions = QuestionDataAccess(db).get_questions_by_quiz(quiz_id)
+        return [
+            {
+                'id': q.id,
+                'quiz_id': q.quiz_id,
+                'question_text': q.question_text,
+                'question_order': q.question_order,
+                'time_limit': q.time_limit
+            }
+            for q in questions
+        ]
+
+
+@st.cache_data(ttl=AUTO_REFRESH_ACTIVE_SESSION, show_spinner=False)
+def cached_options_by_question(question_id: Any) -> List[Dict[str, Any]]:
+    """
+    Get all options for a question as plain dictionaries
+
+    Args:
+        question_id: Question ID
+
+    Returns:
+        List of option dicts ordered by option_order
+    """
+    with db_manager.get_session() as db:
+        options = QuestionDataAccess(db).get_options_by_question(question_id)
+        return [
+            {
+                'id': o.id,
+                'question_id': o.question_id,
+                'option_text': o.option_text,
+                'option_order': o.option_order,
+                'is_correct': o.is_correct
+            }
+            for o in options
+        ]
+
+
+def clear_cached_reads() -> None:
+    """Invalidate cached question and option reads after a write"""
+    cached_questions_by_quiz.clear()
+    cached_options_by_question.clear()
@@ -3,8 +3,8 @@ Question Data Access Layer
 All database queries for question and question option operations
 """
 from typing import List, Optional, Any
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy.orm import Session, selectinload, load_only
+from sqlalchemy import func, delete, insert, case, or_, select
 from database.models.question import Question
 from database.models.question_option import QuestionOption
 from database.base_data_access import BaseDataAccess
@@ -16,24 +16,67 @@ class QuestionDataAccess(BaseDataAccess):
     Handles all database operations for question-related entities.
     """
     
-    def __init__(self, db_session: Session):
+    def __init__(self, db_session: Session, read_session: Optional[Session] = None):
         """
         Initialize data access with database session
 
         Args:
             db_session: SQLAlchemy database session
+            read_session: Optional session for SELECT-only queries
         """
-        super().__init__(db_session)
+        super().__init__(db_session, read_session)
+    
+    def _invalidate_cached_reads(self) -> None:
+        """Drop cached question/option reads after a write (private method)"""
+        # Import here to avoid circular dependency
+        from .cached_reads import clear_cached_reads
+        clear_cached_reads()
+    
+    def _rescore_quiz_sessions(self, quiz_id: Any) -> None:
+        """
+        Recompute participant totals of the quiz's sessions (private method)
+        
+        Call before committing a write that deletes answers (cascade), clears
+        their option (SET NULL) or changes time limits or correct options.
+        """
+        # Import here to avoid circular dependency
+        from features.scoring.scoring_data_access import participant_score_update
+        self.db.execute(participant_score_update(quiz_id=quiz_id))
+    
+    def _quiz_id_of_question(self, question_id: Any):
+        """Scalar subquery for a question's quiz ID (private method)"""
+        return select(Question.quiz_id).where(Question.id == question_id).scalar_subquery()
     
     # ==================== Question Operations ====================
     
-    def get_questions_by_quiz(self, quiz_id: Any) -> List[Question]:
-        """Get all questions for a quiz, ordered by question_order"""
-        return (self.db.query(Question)
+    def get_questions_by_quiz(self, quiz_id: Any, include_options: bool = False) -> List[Question]:
+        """
+        Get all questions for a quiz, ordered by question_order
+        
+        Args:
+            quiz_id: Quiz ID
+            include_options: Also load every question's options in one extra IN query
+        
+        Returns:
+            List of Question instances
+        """
+        query = (self.read_db.query(Question)
+                 .options(load_only(Question.id, Question.quiz_id, Question.question_text,
+                                    Question.question_order, Question.time_limit)))
+        if include_options:
+            query = query.options(selectinload(Question.options))
+        return (query
                 .filter(Question.quiz_id == quiz_id)
                 .order_by(Question.question_order)
                 .all())
     
+    def get_first_question(self, quiz_id: Any) -> Optional[Question]:
+        """Get the first question of a quiz (lowest question_order)"""
+        return (self.db.query(Question)
+                .filter(Question.quiz_id == quiz_id)
+                .order_by(Question.question_order)
+                .first())
+    
     def get_question_by_id(self, question_id: Any) -> Optional[Question]:
         """Get a question by ID"""
         return self.db.query(Question).filter(Question.id == question_id).first()
@@ -54,6 +97,36 @@ class QuestionDataAccess(BaseDataAccess):
         )
         self.add(question)
         self.commit()
+        self._invalidate_cached_reads()
+        # No refresh: the id comes back via RETURNING; other columns load on first access
+        return question
+    
+    def create_question_with_options(
+        self,
+        quiz_id: Any,
+        question_text: str,
+        question_order: int,
+        time_limit: int,
+        options: List[dict]
+    ) -> Question:
+        """Create a question together with its options in a single commit"""
+        question = Question(
+            quiz_id=quiz_id,
+            question_text=question_text,
+            question_order=question_order,
+            time_limit=time_limit
+        )
+        question.options = [
+            QuestionOption(
+                option_text=option['text'],
+                option_order=option['order'],
+                is_correct=option.get('is_correct', False)
+            )
+            for option in options
+        ]
+        self.add(question)
+        self.commit()
+        self._invalidate_cached_reads()
         self.refresh(question)
         return question
     
@@ -61,34 +134,82 @@ class QuestionDataAccess(BaseDataAccess):
         self,
         question_id: Any,
         question_text: str = None,
-        time_limit: int = None
+        time_limit: int = None,
+        flush_only: bool = False
     ) -> Optional[Question]:
-        """Update a question"""
+        """Update a question (flush_only leaves the commit to the caller)"""
         question = self.get_question_by_id(question_id)
         if question:
             if question_text is not None:
                 question.question_text = question_text
-            if time_limit is not None:
+            if time_limit is not None and time_limit != question.time_limit:
                 question.time_limit = time_limit
-            self.commit()
-            self.refresh(question)
+                # Speed points depend on the time limit
+                self.db.flush()
+                self._rescore_quiz_sessions(question.quiz_id)
+            if flush_only:
+                self.flush()
+            else:
+                self.commit()
+                self._invalidate_cached_reads()
+                self.refresh(question)
         return question
     
     def delete_question(self, question_id: Any) -> bool:
-        """Delete a question"""
-        question = self.get_question_by_id(question_id)
-        if question:
-            self.delete(question)
-            self.commit()
-            return True
-        return False
+        """Delete a question (options and answers are removed by FK ON DELETE CASCADE)"""
+        quiz_id = self.db.execute(
+            delete(Question)
+            .where(Question.id == question_id)
+            .returning(Question.quiz_id)
+            .execution_options(synchronize_session=False)
+        ).scalar()
+        if quiz_id is not None:
+            # The cascade removed answers, so totals must drop in the same transaction
+            self._rescore_quiz_sessions(quiz_id)
+        self.commit()
+        self._invalidate_cached_reads()
+        return quiz_id is not None
     
     def get_question_count_by_quiz(self, quiz_id: Any) -> int:
         """Get number of questions in a quiz"""
-        return (self.db.query(func.count(Question.id))
+        return (self.read_db.query(func.count(Question.id))
                 .filter(Question.quiz_id == quiz_id)
                 .scalar() or 0)
     
+    def has_any_question(self, quiz_id: Any) -> bool:
+        """Check if a quiz has at least one question"""
+        return self.read_db.query(
+            self.read_db.query(Question)
+            .filter(Question.quiz_id == quiz_id)
+            .exists()
+        ).scalar()
+    
+    def find_invalid_questions(self, quiz_id: Any) -> List[Any]:
+        """
+        Find questions in a quiz that have no options or no correct option
+        
+        Args:
+            quiz_id: Quiz ID
+        
+        Returns:
+            Rows of (id, question_order, option_count, correct_count) ordered by question_order
+        """
+        option_count = func.count(QuestionOption.id)
+        correct_count = func.coalesce(
+            func.sum(case((QuestionOption.is_correct == True, 1), else_=0)), 0
+        )
+        return (self.read_db.query(
+                    Question.id,
+                    Question.question_order,
+                    option_count.label('option_count'),
+                    correct_count.label('correct_count'))
+                .outerjoin(QuestionOption, QuestionOption.question_id == Question.id)
+                .filter(Question.quiz_id == quiz_id)
+                .group_by(Question.id, Question.question_order)
+                .having(or_(option_count == 0, correct_count == 0))
+                .order_by(Question.question_order)
+                .all())
+    
     # ==================== Question Option Operations ====================
     
     def create_question_option(
@@ -107,16 +228,33 @@ class QuestionDataAccess(BaseDataAccess):
         )
         self.add(option)
         self.commit()
+        self._invalidate_cached_reads()
         self.refresh(option)
         return option
     
+    def create_options_bulk(self, question_id: Any, options: List[dict]) -> List[QuestionOption]:
+        """Insert all options for a question in one round-trip, commit, and return them"""
+        rows = [
+            {
+                'question_id': question_id,
+                'option_text': option['text'],
+                'option_order': option['order'],
+                'is_correct': option.get('is_correct', False)
+            }
+            for option in options
+        ]
+        created = self.db.scalars(insert(QuestionOption).returning(QuestionOption), rows).all()
+        self.commit()
+        self._invalidate_cached_reads()
+        return sorted(created, key=lambda option: option.option_order)
+    
     def get_option_by_id(self, option_id: Any) -> Optional[QuestionOption]:
         """Get an option by ID"""
         return self.db.query(QuestionOption).filter(QuestionOption.id == option_id).first()
     
     def get_options_by_question(self, question_id: Any) -> List[QuestionOption]:
         """Get all options for a question, ordered by option_order"""
-        return (self.db.query(QuestionOption)
+        return (self.read_db.query(QuestionOption)
                 .filter(QuestionOption.question_id == question_id)
                 .order_by(QuestionOption.option_order)
                 .all())
@@ -132,39 +270,59 @@ class QuestionDataAccess(BaseDataAccess):
         if option:
             if option_text is not None:
                 option.option_text = option_text
-            if is_correct is not None:
+            if is_correct is not None and is_correct != option.is_correct:
                 option.is_correct = is_correct
+                self.db.flush()
+                self._rescore_quiz_sessions(self._quiz_id_of_question(option.question_id))
             self.commit()
+            self._invalidate_cached_reads()
             self.refresh(option)
         return option
     
-    def delete_question_options(self, question_id: Any) -> bool:
-        """Delete all options for a question"""
-        self.db.query(QuestionOption).filter(QuestionOption.question_id == question_id).delete()
-        self.commit()
+    def delete_question_options(self, question_id: Any, flush_only: bool = False) -> bool:
+        """
+        Delete all options for a question (answers keep a NULL option and are rescored)
+        
+        flush_only leaves the commit to the caller.
+        """
+        deleted = (self.db.query(QuestionOption)
+                   .filter(QuestionOption.question_id == question_id)
+                   .delete(synchronize_session=False))
+        if deleted:
+            self._rescore_quiz_sessions(self._quiz_id_of_question(question_id))
+        if flush_only:
+            self.flush()
+        else:
+            self.commit()
+            self._invalidate_cached_reads()
         return True
     
     def delete_option_by_id(self, option_id: Any) -> bool:
         """Delete a specific option by ID"""
         option = self.get_option_by_id(option_id)
         if option:
+            question_id = option.question_id
             self.delete(option)
+            self.db.flush()
+            self._rescore_quiz_sessions(self._quiz_id_of_question(question_id))
             self.commit()
+            self._invalidate_cached_reads()
             return True
         return False
     
     def get_correct_option(self, question_id: Any) -> Optional[QuestionOption]:
         """Get the correct option for a question"""
-        return (self.db.query(QuestionOption)
+        return (self.read_db.query(QuestionOption)
                 .filter(QuestionOption.question_id == question_id)
                 .filter(QuestionOption.is_correct == True)
                 .first())
     
     def has_correct_answer(self, question_id: Any) -> bool:
         """Check if a question has at least one correct answer"""
-        count = (self.db.query(func.count(QuestionOption.id))
-                .filter(QuestionOption.question_id == question_id)
-                .filter(QuestionOption.is_correct == True)
-                .scalar() or 0)
-        return count > 0
+        return self.read_db.query(
+            self.read_db.query(QuestionOption)
+            .filter(QuestionOption.question_id == question_id,
+                    QuestionOption.is_correct == True)
+            .exists()
+        ).scalar()
 
@@ -3,12 +3,15 @@ Quiz Data Access Layer
 All database queries for quiz-related operations
 """
 from typing import List, Optional, Dict, Any
+from datetime import datetime
 from sqlalchemy.orm import Session
-from sqlalchemy import desc, func
+from sqlalchemy import desc, func, select
 from database.models.quiz import Quiz
 from database.models.question import Question
 from database.models.quiz_session import QuizSession
 from database.base_data_access import BaseDataAccess
+from shared.cache import cached, invalidate
+from config import COUNT_CACHE_TTL, QUIZZES_PER_PAGE
 
 
 class QuizDataAccess(BaseDataAccess):
@@ -38,6 +41,7 @@ class QuizDataAccess(BaseDataAccess):
         )
         self.add(quiz)
         self.commit()
+        invalidate(f"quiz:count:{instructor_id}", f"quiz:stats:{instructor_id}")
         self.refresh(quiz)
         return quiz
     
@@ -45,12 +49,17 @@ class QuizDataAccess(BaseDataAccess):
         """Get a quiz by ID"""
         return self.db.query(Quiz).filter(Quiz.id == quiz_id).first()
     
-    def get_quizzes_by_instructor(self, instructor_id: Any) -> List[Quiz]:
-        """Get all quizzes created by an instructor"""
-        return (self.db.query(Quiz)
-                .filter(Quiz.instructor_id == instructor_id)
-                .order_by(desc(Quiz.created_at))
-                .all())
+    def get_quizzes_by_instructor(
+        self,
+        instructor_id: Any,
+        limit: int = QUIZZES_PER_PAGE,
+        before_created_at: Optional[datetime] = None
+    ) -> List[Quiz]:
+        """Get one page of an instructor's quizzes, newest first (keyset on created_at)"""
+        query = self.db.query(Quiz).filter(Quiz.instructor_id == instructor_id)
+        if before_created_at is not None:
+            query = query.filter(Quiz.created_at < before_created_at)
+        return query.order_by(desc(Quiz.created_at)).limit(limit).all()
     
     def update_quiz(self, quiz_id: Any, title: str = None, description: str = None) -> Optional[Quiz]:
         """Update a quiz's metadata"""
@@ -68,32 +77,40 @@ class QuizDataAccess(BaseDataAccess):
         """Delete a quiz (cascades to questions)"""
         quiz = self.get_quiz_by_id(quiz_id)
         if quiz:
+            instructor_id = quiz.instructor_id
             self.delete(quiz)
             self.commit()
+            invalidate(f"quiz:count:{instructor_id}", f"quiz:stats:{instructor_id}")
+            # Cascaded question deletes must not linger in the read cache
+            from .cached_reads import clear_cached_reads
+            clear_cached_reads()
             return True
         return False
     
+    @cached(ttl=COUNT_CACHE_TTL, key=lambda self, instructor_id: f"quiz:count:{instructor_id}")
     def get_quiz_count(self, instructor_id: Any) -> int:
         """Get total count of quizzes for an instructor"""
         return (self.db.query(func.count(Quiz.id))
                 .filter(Quiz.instructor_id == instructor_id)
                 .scalar() or 0)
     
+    @cached(ttl=COUNT_CACHE_TTL, key=lambda self, instructor_id: f"quiz:stats:{instructor_id}")
     def get_quiz_stats(self, instructor_id: Any) -> Dict[str, Any]:
-        """Get quiz statistics for an instructor"""
-        total_quizzes = self.get_quiz_count(instructor_id)
-        
-        # Get total questions across all quizzes
-        total_questions = (self.db.query(func.count(Question.id))
-                          .join(Quiz, Question.quiz_id == Quiz.id)
-                          .filter(Quiz.instructor_id == instructor_id)
-                          .scalar() or 0)
-        
-        # Get total sessions across all quizzes
-        total_sessions = (self.db.query(func.count(QuizSession.id))
-                         .join(Quiz, QuizSession.quiz_id == Quiz.id)
-                         .filter(Quiz.instructor_id == instructor_id)
-                         .scalar() or 0)
+        """Get quiz statistics for an instructor (one round-trip)"""
+        # Independent scalar subqueries avoid the questions x sessions fan-out
+        # that joining both tables would produce
+        instructor_quiz_ids = select(Quiz.id).where(Quiz.instructor_id == instructor_id)
+        total_quizzes, total_questions, total_sessions = self.db.execute(select(
+            select(func.count(Quiz.id))
+                .where(Quiz.instructor_id == instructor_id)
+                .scalar_subquery(),
+            select(func.count(Question.id))
+                .where(Question.quiz_id.in_(instructor_quiz_ids))
+                .scalar_subquery(),
+            select(func.count(QuizSession.id))
+                .where(QuizSession.quiz_id.in_(instructor_quiz_ids))
+                .scalar_subquery()
+        )).one()
         
         return {
             'total_quizzes': total_quizzes,
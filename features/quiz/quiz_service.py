@@ -3,9 +3,12 @@ Quiz Service
 Business logic for quiz and question management
 """
 from typing import List, Optional, Dict, Any
+from datetime import datetime
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
 from database.models.quiz import Quiz
 from database.models.question import Question
+from config import QUIZZES_PER_PAGE
 from .quiz_data_access import QuizDataAccess
 from .question_data_access import QuestionDataAccess
 
@@ -17,16 +20,17 @@ class QuizService:
     Uses separate data access layers for quizzes and questions.
     """
     
-    def __init__(self, db_session: Session):
+    def __init__(self, db_session: Session, read_session: Optional[Session] = None):
         """
         Initialize service with database session
         
         Args:
             db_session: SQLAlchemy database session
+            read_session: Optional session for read-only question lookups
         """
         self.db = db_session
         self.quiz_data = QuizDataAccess(db_session)
-        self.question_data = QuestionDataAccess(db_session)
+        self.question_data = QuestionDataAccess(db_session, read_session)
     
     # ==================== Quiz Operations ====================
     
@@ -62,17 +66,25 @@ class QuizService:
         """
         return self.quiz_data.get_quiz_by_id(quiz_id)
     
-    def get_instructor_quizzes(self, instructor_id: Any) -> List[Quiz]:
+    def get_instructor_quizzes(
+        self,
+        instructor_id: Any,
+        limit: int = QUIZZES_PER_PAGE,
+        before_created_at: Optional[datetime] = None
+    ) -> List[Quiz]:
         """
-        Get all quizzes by an instructor
+        Get a page of quizzes by an instructor
         
         Args:
             instructor_id: Instructor user ID
+            limit: Maximum number of quizzes to return
+            before_created_at: Only return quizzes created before this time (cursor
+                from the last quiz of the previous page)
             
         Returns:
             List of Quiz instances ordered by creation date (newest first)
         """
-        return self.quiz_data.get_quizzes_by_instructor(instructor_id)
+        return self.quiz_data.get_quizzes_by_instructor(instructor_id, limit, before_created_at)
     
     def update_quiz(self, quiz_id: Any, title: str = None, description: str = None) -> Optional[Quiz]:
         """
@@ -136,17 +148,18 @@ class QuizService:
     
     # ==================== Question Operations ====================
     
-    def get_quiz_questions(self, quiz_id: Any) -> List[Question]:
+    def get_quiz_questions(self, quiz_id: Any, include_options: bool = True) -> List[Question]:
         """
         Get all questions for a quiz
         
         Args:
             quiz_id: Quiz ID
+            include_options: Eager-load each question's options (the UI renders them)
             
         Returns:
             List of Question instances ordered by question_order
         """
-        return self.question_data.get_questions_by_quiz(quiz_id)
+        return self.question_data.get_questions_by_quiz(quiz_id, include_options)
     
     def get_question(self, question_id: Any) -> Optional[Question]:
         """
@@ -195,26 +208,14 @@ class QuizService:
         if not any(opt.get('is_correct', False) for opt in options):
             raise ValueError("Question must have at least one correct answer")
         
-        # Create question
-        question = self.question_data.create_question(
+        # Create question and options in one transaction
+        return self.question_data.create_question_with_options(
             quiz_id,
             question_text.strip(),
             question_order,
-            time_limit
+            time_limit,
+            options
         )
-        
-        # Create options
-        for option in options:
-            self.question_data.create_question_option(
-                question.id,
-                option['text'],
-                option['order'],
-                option.get('is_correct', False)
-            )
-        
-        # Refresh to get options
-        self.db.refresh(question)
-        return question
     
     def update_question(
         self,
@@ -249,30 +250,26 @@ class QuizService:
         if not any(opt.get('is_correct', False) for opt in options):
             raise ValueError("Question must have at least one correct answer")
         
-        # Update question
+        # Update question and replace its options in one transaction;
+        # create_options_bulk commits all three writes
         question = self.question_data.update_question(
             question_id,
             question_text.strip(),
-            time_limit
+            time_limit,
+            flush_only=True
         )
         
         if not question:
             return None
         
         # Delete old options
-        self.question_data.delete_question_options(question_id)
+        self.question_data.delete_question_options(question_id, flush_only=True)
         
-        # Create new options
-        for option in options:
-            self.question_data.create_question_option(
-                question.id,
-                option['text'],
-                option['order'],
-                option.get('is_correct', False)
-            )
+        # Create new options in a single bulk insert
+        new_options = self.question_data.create_options_bulk(question.id, options)
         
-        # Refresh to get new options
-        self.db.refresh(question)
+        # Attach the inserted rows directly instead of re-querying the collection
+        set_committed_value(question, 'options', new_options)
         return question
     
     def validate_quiz_completeness(self, quiz_id: Any) -> dict:
@@ -289,24 +286,22 @@ class QuizService:
         if not quiz:
             return {'valid': False, 'message': 'Quiz not found'}
         
-        questions = self.get_quiz_questions(quiz_id)
-        if not questions:
+        if not self.question_data.has_any_question(quiz_id):
             return {'valid': False, 'message': 'Quiz has no questions'}
         
-        # Check each question has options
-        for question in questions:
-            if not question.options or len(question.options) == 0:
+        # Questions missing options or a correct answer are found in SQL
+        invalid_questions = self.question_data.find_invalid_questions(quiz_id)
+        if invalid_questions:
+            question = invalid_questions[0]
+            if question.option_count == 0:
                 return {
                     'valid': False,
                     'message': f'Question {question.question_order} has no options'
                 }
-            
-            # Check at least one correct answer
-            if not any(opt.is_correct for opt in question.options):
-                return {
-                    'valid': False,
-                    'message': f'Question {question.question_order} has no correct answer'
-                }
+            return {
+                'valid': False,
+                'message': f'Question {question.question_order} has no correct answer'
+            }
         
         return {'valid': True}
 
@@ -2,12 +2,89 @@
 Scoring/Answer Data Access Layer
 All database queries for student answer operations
 """
-from typing import List, Optional, Any
-from sqlalchemy.orm import Session
-from sqlalchemy import func
-from datetime import datetime
+from typing import List, Optional, Any, Tuple, Iterator
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.dialects.postgresql import insert as pg_insert, aggregate_order_by
+from sqlalchemy import func, select, update, literal_column, Integer
+from sqlalchemy.sql.dml import Update
 from database.models.student_ansawer import StudentAnswer
+from database.models.question import Question
+from database.models.question_option import QuestionOption
+from database.models.session_participiant import SessionParticipant
+from database.models.quiz_session import QuizSession
 from database.base_data_access import BaseDataAccess
+from shared.cache import cached, invalidate
+from config import COUNT_CACHE_TTL, BASE_POINTS, MAX_SPEED_PENALTY
+
+
+def participant_score_update(
+    session_id: Any = None,
+    student_id: Any = None,
+    quiz_id: Any = None
+) -> Update:
+    """
+    Build an UPDATE that recomputes participants' denormalized score totals
+    
+    A correct answer is worth BASE_POINTS minus a speed penalty of up to
+    MAX_SPEED_PENALTY, proportional to the share of the time limit used
+    (measured from session start). With no arguments it rebuilds
+    every participant (used for backfills). Run it in the same transaction as
+    any write that changes what answers are worth.
+    
+    Args:
+        session_id: Only update participants of this session
+        student_id: Only update this student's participation
+        quiz_id: Only update participants of this quiz's sessions (value or scalar subquery)
+    
+    Returns:
+        UPDATE statement on session_participants
+    """
+    answers = (StudentAnswer.session_id == SessionParticipant.session_id,
+               StudentAnswer.student_id == SessionParticipant.student_id)
+    is_correct = QuestionOption.is_correct == True
+    
+    time_taken = func.greatest(0, func.least(
+        func.extract('epoch', StudentAnswer.submitted_at
+                     - func.coalesce(QuizSession.start_time, QuizSession.created_at)),
+        Question.time_limit
+    ))
+    points = func.greatest(
+        0,
+        BASE_POINTS - func.trunc(time_taken / Question.time_limit * MAX_SPEED_PENALTY)
+    )
+    
+    answered = (select(func.count(StudentAnswer.id))
+                .where(*answers)
+                .correlate(SessionParticipant)
+                .scalar_subquery())
+    correct = (select(func.count(StudentAnswer.id))
+               .join(QuestionOption, StudentAnswer.option_id == QuestionOption.id)
+               .where(*answers, is_correct)
+               .correlate(SessionParticipant)
+               .scalar_subquery())
+    total_points = (select(func.coalesce(func.sum(points), 0).cast(Integer))
+                    .select_from(StudentAnswer)
+                    .join(QuestionOption, StudentAnswer.option_id == QuestionOption.id)
+                    .join(Question, StudentAnswer.question_id == Question.id)
+                    .join(QuizSession, StudentAnswer.session_id == QuizSession.id)
+                    .where(*answers, is_correct)
+                    .correlate(SessionParticipant)
+                    .scalar_subquery())
+    
+    stmt = update(SessionParticipant).values(
+        answered_count=answered,
+        correct_count=correct,
+        total_points=total_points
+    )
+    if session_id is not None:
+        stmt = stmt.where(SessionParticipant.session_id == session_id)
+    if student_id is not None:
+        stmt = stmt.where(SessionParticipant.student_id == student_id)
+    if quiz_id is not None:
+        stmt = stmt.where(SessionParticipant.session_id.in_(
+            select(QuizSession.id).where(QuizSession.quiz_id == quiz_id)
+        ))
+    return stmt
 
 
 class ScoringDataAccess(BaseDataAccess):
@@ -42,7 +119,8 @@ class ScoringDataAccess(BaseDataAccess):
             option_id=option_id
         )
         self.add(answer)
-        self.commit()
+        self.db.flush()
+        self.flush_answers(session_id, student_id)
         self.refresh(answer)
         return answer
     
@@ -70,38 +148,97 @@ class ScoringDataAccess(BaseDataAccess):
         question_id: Any,
         option_id: Any
     ) -> StudentAnswer:
-        """Submit a student answer (create or update)"""
-        # Check if answer already exists
-        existing = self.get_student_answer(session_id, student_id, question_id)
+        """Submit a student answer (create or update) with a single atomic UPSERT"""
+        answer = self._stage_answers(session_id, student_id, [(question_id, option_id)])[0]
+        self.flush_answers(session_id, student_id)
+        return answer
+    
+    def submit_answers(
+        self,
+        session_id: Any,
+        student_id: Any,
+        answers: List[Tuple[Any, Any]]
+    ) -> List[StudentAnswer]:
+        """
+        Submit several (question_id, option_id) answers with one UPSERT and one commit
         
-        if existing:
-            # Update existing answer
-            existing.option_id = option_id
-            existing.submitted_at = datetime.utcnow()
-            self.commit()
-            self.refresh(existing)
-            return existing
-        else:
-            # Create new answer
-            return self.create_answer(session_id, student_id, question_id, option_id)
+        If a question appears more than once, the last answer for it wins.
+        """
+        if not answers:
+            return []
+        # ON CONFLICT DO UPDATE cannot touch the same row twice in one statement
+        staged = self._stage_answers(session_id, student_id, list(dict(answers).items()))
+        self.flush_answers(session_id, student_id)
+        return staged
+    
+    def _stage_answers(
+        self,
+        session_id: Any,
+        student_id: Any,
+        answers: List[Tuple[Any, Any]]
+    ) -> List[StudentAnswer]:
+        """Upsert answers in the current transaction without committing (private method)"""
+        # submitted_at comes from the database clock: server_default on insert, now() on update
+        insert_stmt = pg_insert(StudentAnswer).values([
+            {
+                'session_id': session_id,
+                'student_id': student_id,
+                'question_id': question_id,
+                'option_id': option_id
+            }
+            for question_id, option_id in answers
+        ])
+        stmt = (insert_stmt
+                .on_conflict_do_update(
+                    index_elements=['session_id', 'student_id', 'question_id'],
+                    set_={'option_id': insert_stmt.excluded.option_id,
+                          'submitted_at': func.now()})
+                .returning(StudentAnswer))
+        return self.db.scalars(
+            stmt,
+            execution_options={"populate_existing": True}
+        ).all()
+    
+    def flush_answers(self, session_id: Any, student_id: Any) -> None:
+        """Update the participant's score totals, commit staged answers and drop cached counts"""
+        self.db.execute(participant_score_update(session_id, student_id))
+        self.commit()
+        invalidate(f"answers:count:student:{student_id}", f"answers:count:session:{session_id}")
     
     def delete_answer(self, answer_id: Any) -> bool:
         """Delete an answer"""
         answer = self.get_answer_by_id(answer_id)
         if answer:
+            student_id, session_id = answer.student_id, answer.session_id
             self.db.delete(answer)
-            self.commit()
+            self.db.flush()
+            self.flush_answers(session_id, student_id)
             return True
         return False
     
     # ==================== Answer Query Operations ====================
     
     def get_answers_by_session(self, session_id: Any) -> List[StudentAnswer]:
-        """Get all answers for a session"""
+        """Get all answers for a session with selected option and question eagerly loaded"""
         return (self.db.query(StudentAnswer)
+                .options(joinedload(StudentAnswer.selected_option),
+                         joinedload(StudentAnswer.question))
                 .filter(StudentAnswer.session_id == session_id)
                 .all())
     
+    def iter_answers_by_session(
+        self,
+        session_id: Any,
+        chunk_size: int = 500
+    ) -> Iterator[List[StudentAnswer]]:
+        """Stream a session's answers in chunks (selected option and question eagerly loaded)"""
+        stmt = (select(StudentAnswer)
+                .options(joinedload(StudentAnswer.selected_option),
+                         joinedload(StudentAnswer.question))
+                .where(StudentAnswer.session_id == session_id)
+                .execution_options(yield_per=chunk_size))
+        yield from self.db.scalars(stmt).partitions()
+    
     def get_answers_by_student_and_session(
         self,
         session_id: Any,
@@ -128,12 +265,14 @@ class ScoringDataAccess(BaseDataAccess):
                        StudentAnswer.student_id == student_id)
                 .count())
     
+    @cached(ttl=COUNT_CACHE_TTL, key=lambda self, student_id: f"answers:count:student:{student_id}")
     def count_answers_by_student(self, student_id: Any) -> int:
         """Count total answers by a student across all sessions"""
         return (self.db.query(func.count(StudentAnswer.id))
                 .filter(StudentAnswer.student_id == student_id)
                 .scalar() or 0)
     
+    @cached(ttl=COUNT_CACHE_TTL, key=lambda self, session_id: f"answers:count:session:{session_id}")
     def count_answers_by_session(self, session_id: Any) -> int:
         """Count total answers in a session"""
         return (self.db.query(func.count(StudentAnswer.id))
@@ -143,9 +282,44 @@ class ScoringDataAccess(BaseDataAccess):
     def get_correct_answers_count(self, session_id: Any, student_id: Any) -> int:
         """Count correct answers by a student in a session"""
         return (self.db.query(func.count(StudentAnswer.id))
-                .join(StudentAnswer.selected_option)
+                .join(QuestionOption, StudentAnswer.option_id == QuestionOption.id)
                 .filter(StudentAnswer.session_id == session_id,
                        StudentAnswer.student_id == student_id,
-                       StudentAnswer.selected_option.has(is_correct=True))
+                       QuestionOption.is_correct == True)
                 .scalar() or 0)
-
+    
+    def get_leaderboard_version(self, session_id: Any) -> str:
+        """
+        Get a cheap fingerprint of a session's leaderboard inputs
+        
+        Hashes every participant's stored totals together with the latest
+        answer submission time and the quiz's question count, so it changes
+        whenever a student joins, answers or changes an answer (the upsert bumps
+        submitted_at even when the totals stay the same) and whenever a quiz
+        edit rescores participants or deletes their answers.
+        """
+        participant_totals = func.concat_ws(
+            ':',
+            SessionParticipant.student_id,
+            SessionParticipant.total_points,
+            SessionParticipant.correct_count,
+            SessionParticipant.answered_count
+        )
+        totals_hash = (select(func.md5(func.string_agg(
+                           participant_totals,
+                           aggregate_order_by(literal_column("','"), SessionParticipant.student_id)
+                       )))
+                       .where(SessionParticipant.session_id == session_id)
+                       .scalar_subquery())
+        last_submitted_at = (select(func.max(StudentAnswer.submitted_at))
+                             .where(StudentAnswer.session_id == session_id)
+                             .scalar_subquery())
+        quiz_id = select(QuizSession.quiz_id).where(QuizSession.id == session_id).scalar_subquery()
+        question_count = (select(func.count(Question.id))
+                          .where(Question.quiz_id == quiz_id)
+                          .scalar_subquery())
+        totals, last_ts, questions = self.db.execute(
+            select(totals_hash, last_submitted_at, question_count)
+        ).one()
+        last_ts = last_ts.timestamp() if last_ts else 0
+        return f"{totals or 'empty'}:{last_ts}:{questions}"
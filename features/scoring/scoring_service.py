@@ -2,12 +2,13 @@
 Scoring Service
 Business logic for scoring, leaderboard calculations, and answer management
 """
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
+from collections import defaultdict
 from sqlalchemy.orm import Session
-from datetime import datetime
 from database.models.quiz_session import QuizSession
 from database.models.student_ansawer import StudentAnswer
-from config import BASE_POINTS, SPEED_PENALTY_MULTIPLIER
+from config import LEADERBOARD_CACHE_TTL
+from shared.cache import get_redis, cache_get, cache_set
 from .scoring_data_access import ScoringDataAccess
 
 
@@ -55,6 +56,25 @@ class ScoringService:
             option_id
         )
     
+    def submit_answers(
+        self,
+        session_id: Any,
+        student_id: Any,
+        answers: List[Tuple[Any, Any]]
+    ) -> List[StudentAnswer]:
+        """
+        Submit several answers at once (e.g. at the end of a quiz)
+        
+        Args:
+            session_id: Session ID
+            student_id: Student user ID
+            answers: List of (question_id, option_id) pairs, one per question
+            
+        Returns:
+            Created/Updated StudentAnswer instances
+        """
+        return self.data_access.submit_answers(session_id, student_id, answers)
+    
     def get_student_answer(
         self,
         session_id: Any,
@@ -76,44 +96,16 @@ class ScoringService:
         """Count how many questions a student has answered"""
         return self.data_access.count_student_answers(session_id, student_id)
     
+    def count_session_answers(self, session_id: Any) -> int:
+        """Count all answers submitted in a session"""
+        return self.data_access.count_answers_by_session(session_id)
+    
     def count_total_answers_by_student(self, student_id: Any) -> int:
         """Count total answers by a student across all sessions"""
         return self.data_access.count_answers_by_student(student_id)
     
     # ==================== Scoring Calculations ====================
     
-    def calculate_answer_score(
-        self,
-        answer: StudentAnswer,
-        question_start_time: datetime,
-        time_limit: int
-    ) -> int:
-        """
-        Calculate score for a single answer based on correctness and speed
-        
-        Args:
-            answer: StudentAnswer object
-            question_start_time: When the question was presented
-            time_limit: Question time limit in seconds
-            
-        Returns:
-            Score points (0 if incorrect, BASE_POINTS - speed_penalty if correct)
-        """
-        # Check if answer is correct
-        if not answer.selected_option or not answer.selected_option.is_correct:
-            return 0
-        
-        # Calculate time taken in seconds
-        time_taken = (answer.submitted_at - question_start_time).total_seconds()
-        time_taken = max(0, min(time_taken, time_limit))  # Clamp between 0 and time_limit
-        
-        # Calculate speed penalty
-        speed_penalty = int((time_taken / time_limit) * BASE_POINTS * SPEED_PENALTY_MULTIPLIER)
-        
-        # Final score
-        score = BASE_POINTS - speed_penalty
-        return max(0, score)  # Ensure non-negative
-    
     def calculate_leaderboard(self, session: QuizSession) -> List[Dict]:
         """
         Calculate leaderboard for a quiz session
@@ -124,6 +116,20 @@ class ScoringService:
         Returns:
             List of leaderboard entries sorted by score (descending)
         """
+        if get_redis() is None:
+            return self._compute_leaderboard(session)
+        
+        # The key changes whenever participant totals or the question count change,
+        # so no explicit invalidation is needed
+        key = f"lb:{session.id}:{self.data_access.get_leaderboard_version(session.id)}"
+        leaderboard = cache_get(key)
+        if leaderboard is None:
+            leaderboard = self._compute_leaderboard(session)
+            cache_set(key, LEADERBOARD_CACHE_TTL, leaderboard)
+        return leaderboard
+    
+    def _compute_leaderboard(self, session: QuizSession) -> List[Dict]:
+        """Build the leaderboard from the database (uncached)"""
         # Import here to avoid circular dependency
         from features.session import ParticipantDataAccess
         from features.quiz import QuestionDataAccess
@@ -131,62 +137,34 @@ class ScoringService:
         participant_data = ParticipantDataAccess(self.db)
         question_data = QuestionDataAccess(self.db)
         
-        # Get all participants
-        participants = participant_data.get_participants_by_session(session.id)
-        
-        # Get all questions for this quiz
-        questions = question_data.get_questions_by_quiz(session.quiz_id)
-        total_questions = len(questions)
+        # Count questions for this quiz
+        total_questions = question_data.get_question_count_by_quiz(session.quiz_id)
         
         if total_questions == 0:
             return []
         
-        # Get all answers for this session
-        all_answers = self.data_access.get_answers_by_session(session.id)
-        
-        # Group answers by student
-        student_scores = {}
-        for participant in participants:
-            student_id = participant.student_id
-            student = participant.student
-            
-            # Get student's answers
-            student_answers = [a for a in all_answers if a.student_id == student_id]
-            
-            total_points = 0
-            correct_count = 0
-            
-            for answer in student_answers:
-                # Use session start time as question start time
-                question_start_time = session.start_time or session.created_at
-                
-                score = self.calculate_answer_score(
-                    answer,
-                    question_start_time,
-                    answer.question.time_limit
-                )
-                total_points += score
-                
-                if answer.selected_option and answer.selected_option.is_correct:
-                    correct_count += 1
-            
-            answered_count = len(student_answers)
+        # Totals are maintained on the participant rows as answers are submitted
+        student_scores = []
+        for student_id, username, total_points, correct_count, answered_count in (
+            participant_data.get_session_standings(session.id)
+        ):
             percent_correct = (correct_count / answered_count * 100) if answered_count > 0 else 0
             
-            student_scores[student_id] = {
-                'student_id': student_id,
-                'student_name': student.username,
+            # Entries are cached as JSON, so the UUID is stored as a string
+            student_scores.append({
+                'student_id': str(student_id),
+                'student_name': username,
                 'total_points': total_points,
                 'correct_count': correct_count,
                 'total_questions': total_questions,
                 'answered_count': answered_count,
                 'percent_correct': round(percent_correct, 1),
                 'participation': f"{answered_count}/{total_questions}"
-            }
+            })
         
         # Sort by total points (desc), then by percent correct (desc)
         leaderboard = sorted(
-            student_scores.values(),
+            student_scores,
             key=lambda x: (x['total_points'], x['percent_correct']),
             reverse=True
         )
@@ -207,31 +185,42 @@ class ScoringService:
         Returns:
             List of result entries with per-question breakdown
         """
+        if get_redis() is None:
+            return self._compute_detailed_results(session)
+        
+        key = f"results:{session.id}:{self.data_access.get_leaderboard_version(session.id)}"
+        detailed_results = cache_get(key)
+        if detailed_results is None:
+            detailed_results = self._compute_detailed_results(session)
+            cache_set(key, LEADERBOARD_CACHE_TTL, detailed_results)
+        return detailed_results
+    
+    def _compute_detailed_results(self, session: QuizSession) -> List[Dict]:
+        """Build the detailed results table from the database (uncached)"""
         from features.quiz import QuestionDataAccess
         question_data = QuestionDataAccess(self.db)
         
         leaderboard = self.calculate_leaderboard(session)
         questions = question_data.get_questions_by_quiz(session.quiz_id)
-        all_answers = self.data_access.get_answers_by_session(session.id)
         
-        # Map question IDs to question numbers
-        question_map = {q.id: idx + 1 for idx, q in enumerate(questions)}
+        # Column name for each question, in quiz order
+        question_columns = [(f'q{idx}', q.id) for idx, q in enumerate(questions, start=1)]
+        
+        # Build per-student answer maps (question_id -> option letter),
+        # streaming answers in chunks so large sessions are never fully materialized
+        answers_by_student = defaultdict(dict)
+        for chunk in self.data_access.iter_answers_by_session(session.id):
+            for answer in chunk:
+                if answer.selected_option:
+                    # Convert option order to letter (1->A, 2->B, 3->C, 4->D)
+                    answers_by_student[str(answer.student_id)][answer.question_id] = chr(
+                        64 + answer.selected_option.option_order
+                    )
         
         detailed_results = []
         
         for entry in leaderboard:
-            student_id = entry['student_id']
-            
-            # Get student's answers
-            student_answers = [a for a in all_answers if a.student_id == student_id]
-            
-            # Build answer map (question_id -> option_order)
-            answer_map = {}
-            for answer in student_answers:
-                if answer.selected_option:
-                    # Convert option order to letter (1->A, 2->B, 3->C, 4->D)
-                    option_letter = chr(64 + answer.selected_option.option_order)
-                    answer_map[answer.question_id] = option_letter
+            answer_map = answers_by_student.get(entry['student_id'], {})
             
             # Build result entry
             result = {
@@ -243,9 +232,8 @@ class ScoringService:
             }
             
             # Add per-question answers
-            for question in questions:
-                q_num = question_map[question.id]
-                result[f'q{q_num}'] = answer_map.get(question.id, '-')
+            for column, question_id in question_columns:
+                result[column] = answer_map.get(question_id, '-')
             
             detailed_results.append(result)
         
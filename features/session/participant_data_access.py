@@ -2,11 +2,13 @@
 Participant Data Access Layer
 All database queries for session participant operations
 """
-from typing import List, Optional, Any
-from sqlalchemy.orm import Session
+from typing import List, Optional, Any, Tuple, Iterator
+from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from database.models.session_participiant import SessionParticipant
 from database.models.quiz_session import QuizSession
+from database.models.user import User
 from database.base_data_access import BaseDataAccess
 
 
@@ -27,21 +29,83 @@ class ParticipantDataAccess(BaseDataAccess):
     
     # ==================== Participant Operations ====================
     
-    def add_participant(self, session_id: Any, student_id: Any) -> SessionParticipant:
+    def add_participant(
+        self,
+        session_id: Any,
+        student_id: Any
+    ) -> SessionParticipant:
         """Add a participant to a session"""
         participant = SessionParticipant(
             session_id=session_id,
             student_id=student_id
         )
-        self.add(participant)
+        return self.save(participant)
+    
+    def add_participant_idempotent(
+        self,
+        session_id: Any,
+        student_id: Any
+    ) -> Tuple[Optional[SessionParticipant], bool]:
+        """
+        Add a participant unless already joined, in one INSERT ... ON CONFLICT DO NOTHING
+        
+        Returns:
+            (participant, created) - participant is None when the student had already joined
+        """
+        stmt = (pg_insert(SessionParticipant)
+                .values(session_id=session_id, student_id=student_id)
+                .on_conflict_do_nothing(index_elements=['session_id', 'student_id'])
+                .returning(SessionParticipant))
+        participant = self.db.scalars(stmt).one_or_none()
+        self.commit()
+        return participant, participant is not None
+    
+    def add_many_participants(self, session_id: Any, student_ids: List[Any]) -> int:
+        """
+        Add several participants (e.g. a roster import) with one batched insert and commit
+        
+        Students who already joined are skipped.
+        
+        Returns:
+            Number of participants actually added
+        """
+        if not student_ids:
+            return 0
+        stmt = (pg_insert(SessionParticipant)
+                .on_conflict_do_nothing(index_elements=['session_id', 'student_id'])
+                .returning(SessionParticipant.id))
+        # executemany with RETURNING is batched by insertmanyvalues (1000 rows per statement)
+        added = self.db.execute(
+            stmt,
+            [{'session_id': session_id, 'student_id': student_id} for student_id in student_ids]
+        ).all()
         self.commit()
-        self.refresh(participant)
-        return participant
+        return len(added)
     
     def get_participants_by_session(self, session_id: Any) -> List[SessionParticipant]:
-        """Get all participants in a session"""
+        """Get all participants in a session (with their student loaded)"""
         return (self.db.query(SessionParticipant)
+                .options(joinedload(SessionParticipant.student))
+                .filter(SessionParticipant.session_id == session_id)
+                .all())
+    
+    def iter_participants_by_session(self, session_id: Any, chunk_size: int = 500) -> Iterator[Any]:
+        """Stream (student_id, joined_at) rows for a session without building a list"""
+        yield from (self.db.query(SessionParticipant.student_id, SessionParticipant.joined_at)
+                    .filter(SessionParticipant.session_id == session_id)
+                    .yield_per(chunk_size))
+    
+    def get_session_standings(self, session_id: Any) -> List[Any]:
+        """Get (student_id, username, total_points, correct_count, answered_count) rows, best first"""
+        return (self.db.query(
+                    SessionParticipant.student_id,
+                    User.username,
+                    SessionParticipant.total_points,
+                    SessionParticipant.correct_count,
+                    SessionParticipant.answered_count)
+                .join(User, SessionParticipant.student_id == User.id)
                 .filter(SessionParticipant.session_id == session_id)
+                .order_by(SessionParticipant.total_points.desc())
                 .all())
     
     def get_participant(self, session_id: Any, student_id: Any) -> Optional[SessionParticipant]:
@@ -53,7 +117,12 @@ class ParticipantDataAccess(BaseDataAccess):
     
     def is_participant(self, session_id: Any, student_id: Any) -> bool:
         """Check if a student is a participant in a session"""
-        return self.get_participant(session_id, student_id) is not None
+        return self.db.query(
+            self.db.query(SessionParticipant)
+            .filter(SessionParticipant.session_id == session_id,
+                    SessionParticipant.student_id == student_id)
+            .exists()
+        ).scalar()
     
     def get_participant_count(self, session_id: Any) -> int:
         """Get count of participants in a session"""
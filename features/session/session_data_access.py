@@ -2,15 +2,23 @@
 Session Data Access Layer
 All database queries for quiz session operations
 """
-from typing import List, Optional, Dict, Any
-from sqlalchemy.orm import Session
-from sqlalchemy import desc, func
-from datetime import datetime
+from typing import List, Optional, Dict, Any, Tuple
+from threading import RLock
+from cachetools import TTLCache
+from sqlalchemy.orm import Session, contains_eager, raiseload
+from sqlalchemy import desc, func, update, select
 from database.models.quiz_session import QuizSession
 from database.models.session_participiant import SessionParticipant
 from database.models.quiz import Quiz
+from database.models.question import Question
 from database.models import SessionStatus
 from database.base_data_access import BaseDataAccess
+from database import utc_now
+from config import SESSION_CODE_CACHE_TTL, DETECT_N_PLUS_ONE
+
+# session_code -> (session_id, status), shared by all script threads
+_code_cache: TTLCache = TTLCache(maxsize=10_000, ttl=SESSION_CODE_CACHE_TTL)
+_code_cache_lock = RLock()
 
 
 class SessionDataAccess(BaseDataAccess):
@@ -44,15 +52,34 @@ class SessionDataAccess(BaseDataAccess):
             session_code=session_code,
             status=SessionStatus.PENDING
         )
-        self.add(session)
-        self.commit()
-        self.refresh(session)
-        return session
+        return self.save(session)
     
     def get_session_by_id(self, session_id: Any) -> Optional[QuizSession]:
         """Get a session by ID"""
         return self.db.query(QuizSession).filter(QuizSession.id == session_id).first()
     
+    def get_session_route_by_code(self, session_code: str) -> Optional[Tuple[Any, SessionStatus]]:
+        """Get (session_id, status) for a session code, cached for a few seconds"""
+        with _code_cache_lock:
+            route = _code_cache.get(session_code)
+        if route is not None:
+            return route
+        
+        route = (self.db.query(QuizSession.id, QuizSession.status)
+                 .filter(QuizSession.session_code == session_code)
+                 .first())
+        if route is None:
+            return None
+        route = tuple(route)
+        with _code_cache_lock:
+            _code_cache[session_code] = route
+        return route
+    
+    def _invalidate_code_cache(self, session_code: str) -> None:
+        """Drop a cached code route after the session changes (private method)"""
+        with _code_cache_lock:
+            _code_cache.pop(session_code, None)
+    
     def get_session_by_code(self, session_code: str) -> Optional[QuizSession]:
         """Get session by session code"""
         return (self.db.query(QuizSession)
@@ -63,8 +90,10 @@ class SessionDataAccess(BaseDataAccess):
         """Delete a session"""
         session = self.get_session_by_id(session_id)
         if session:
+            session_code = session.session_code
             self.delete(session)
             self.commit()
+            self._invalidate_code_cache(session_code)
             return True
         return False
     
@@ -73,30 +102,102 @@ class SessionDataAccess(BaseDataAccess):
     def update_status(self, session_id: Any, status: SessionStatus) -> Optional[QuizSession]:
         """Update session status with automatic timestamp management"""
         session = self.get_session_by_id(session_id)
-        print("ana_honnnnnn")
-        print(session)
         if session:
             session.status = status
             
             # Set timestamps based on status
             if status == SessionStatus.ACTIVE and not session.start_time:
-                session.start_time = datetime.utcnow()
+                session.start_time = utc_now()
             elif status == SessionStatus.CLOSED and not session.end_time:
-                session.end_time = datetime.utcnow()
+                session.end_time = utc_now()
             
             self.commit()
+            self._invalidate_code_cache(session.session_code)
             self.refresh(session)
         return session
     
+    def start_session_atomic(self, session_id: Any, first_question_id: Any) -> Optional[QuizSession]:
+        """Activate a session and set its first question in one UPDATE ... RETURNING"""
+        stmt = (update(QuizSession)
+                .where(QuizSession.id == session_id)
+                .values(status=SessionStatus.ACTIVE,
+                        start_time=func.coalesce(QuizSession.start_time, func.now()),
+                        current_question_id=first_question_id,
+                        current_question_index=0)
+                .returning(QuizSession))
+        return self._update_session_returning(stmt)
+    
+    def end_session_atomic(self, session_id: Any) -> Optional[QuizSession]:
+        """Close a session and stamp its end time in one UPDATE ... RETURNING"""
+        stmt = (update(QuizSession)
+                .where(QuizSession.id == session_id)
+                .values(status=SessionStatus.CLOSED,
+                        end_time=func.coalesce(QuizSession.end_time, func.now()))
+                .returning(QuizSession))
+        return self._update_session_returning(stmt)
+    
+    def advance_question_atomic(
+        self,
+        session_id: Any,
+        current_question_id: Optional[Any]
+    ) -> Optional[QuizSession]:
+        """
+        Move a session from current_question_id to the next question in one UPDATE ... RETURNING
+        
+        The next question is looked up inside the statement, and the row is only
+        updated if it still points at current_question_id, so concurrent clicks
+        cannot skip a question.
+        
+        Returns:
+            Updated QuizSession, or None if there is no next question (or another
+            request advanced the session first)
+        """
+        conditions = [Question.quiz_id == QuizSession.quiz_id]
+        if current_question_id is not None:
+            current_order = (select(Question.question_order)
+                             .where(Question.id == current_question_id)
+                             .scalar_subquery())
+            conditions.append(Question.question_order > current_order)
+        next_question_id = (select(Question.id)
+                            .where(*conditions)
+                            .order_by(Question.question_order)
+                            .limit(1)
+                            .correlate(QuizSession)
+                            .scalar_subquery())
+        
+        stmt = (update(QuizSession)
+                .where(QuizSession.id == session_id,
+                       QuizSession.current_question_id.is_not_distinct_from(current_question_id),
+                       next_question_id.is_not(None))
+                .values(current_question_id=next_question_id,
+                        # Stays unknown (NULL) for sessions started before the index was stored
+                        current_question_index=(0 if current_question_id is None
+                                                else QuizSession.current_question_index + 1))
+                .returning(QuizSession))
+        return self._update_session_returning(stmt)
+    
+    def _update_session_returning(self, stmt) -> Optional[QuizSession]:
+        """Run an UPDATE ... RETURNING on quiz_sessions and commit (private method)"""
+        session = self.db.scalars(
+            stmt,
+            execution_options={"populate_existing": True}
+        ).one_or_none()
+        self.commit()
+        if session:
+            self._invalidate_code_cache(session.session_code)
+        return session
+    
     def update_current_question(
         self,
         session_id: Any,
-        question_id: Any
+        question_id: Any,
+        question_index: Optional[int] = None
     ) -> Optional[QuizSession]:
-        """Update the current question for a session"""
+        """Update the current question (and its position in the quiz) for a session"""
         session = self.get_session_by_id(session_id)
         if session:
             session.current_question_id = question_id
+            session.current_question_index = question_index
             self.commit()
             self.refresh(session)
         return session
@@ -117,6 +218,41 @@ class SessionDataAccess(BaseDataAccess):
         
         return query.order_by(desc(QuizSession.created_at)).all()
     
+    def get_sessions_by_instructor_summary(
+        self,
+        instructor_id: Any,
+        status: Optional[SessionStatus] = None,
+        limit: Optional[int] = None
+    ) -> List[Any]:
+        """
+        Get lightweight session rows for list views, newest first
+        
+        Rows carry id, session_code, status, start_time, end_time, created_at,
+        quiz_title and participant_count, so no ORM objects or lazy loads are involved.
+        """
+        query = (self.db.query(
+                    QuizSession.id,
+                    QuizSession.session_code,
+                    QuizSession.status,
+                    QuizSession.start_time,
+                    QuizSession.end_time,
+                    QuizSession.created_at,
+                    Quiz.title.label('quiz_title'),
+                    func.count(SessionParticipant.id).label('participant_count'))
+                 .join(Quiz, QuizSession.quiz_id == Quiz.id)
+                 .outerjoin(SessionParticipant, QuizSession.id == SessionParticipant.session_id)
+                 .filter(QuizSession.instructor_id == instructor_id))
+        
+        if status:
+            query = query.filter(QuizSession.status == status)
+        
+        query = (query
+                 .group_by(QuizSession.id, Quiz.title)
+                 .order_by(desc(QuizSession.created_at)))
+        if limit:
+            query = query.limit(limit)
+        return query.all()
+    
     def get_recent_sessions(
         self,
         instructor_id: Any,
@@ -131,7 +267,11 @@ class SessionDataAccess(BaseDataAccess):
     
     def session_code_exists(self, session_code: str) -> bool:
         """Check if a session code already exists"""
-        return self.get_session_by_code(session_code) is not None
+        return self.db.query(
+            self.db.query(QuizSession)
+            .filter(QuizSession.session_code == session_code)
+            .exists()
+        ).scalar()
     
     # ==================== Session Statistics ====================
     
@@ -147,41 +287,55 @@ class SessionDataAccess(BaseDataAccess):
         return query.scalar() or 0
     
     def get_session_stats(self, instructor_id: Any) -> Dict[str, int]:
-        """Get session statistics for an instructor"""
-        total = (self.db.query(func.count(QuizSession.id))
-                .filter(QuizSession.instructor_id == instructor_id)
-                .scalar() or 0)
-        
-        active = (self.db.query(func.count(QuizSession.id))
-                 .filter(QuizSession.instructor_id == instructor_id,
-                        QuizSession.status == SessionStatus.ACTIVE)
-                 .scalar() or 0)
-        
-        closed = (self.db.query(func.count(QuizSession.id))
-                 .filter(QuizSession.instructor_id == instructor_id,
-                        QuizSession.status == SessionStatus.CLOSED)
-                 .scalar() or 0)
-        
-        pending = (self.db.query(func.count(QuizSession.id))
-                  .filter(QuizSession.instructor_id == instructor_id,
-                         QuizSession.status == SessionStatus.PENDING)
-                  .scalar() or 0)
+        """Get session statistics for an instructor (one GROUP BY over status)"""
+        counts = {status: 0 for status in SessionStatus}
+        counts.update(self.db.query(QuizSession.status, func.count(QuizSession.id))
+                      .filter(QuizSession.instructor_id == instructor_id)
+                      .group_by(QuizSession.status)
+                      .all())
         
         return {
-            'total': total,
-            'active': active,
-            'closed': closed,
-            'pending': pending
+            'total': sum(counts.values()),
+            'active': counts[SessionStatus.ACTIVE],
+            'closed': counts[SessionStatus.CLOSED],
+            'pending': counts[SessionStatus.PENDING]
         }
     
+    def get_dashboard_counters(self, instructor_id: Any) -> Dict[str, int]:
+        """Get session counts by status plus unique participants in one query"""
+        count_status = lambda status: func.count(QuizSession.id).filter(QuizSession.status == status)
+        unique_participants = (select(func.count(func.distinct(SessionParticipant.student_id)))
+                               .join(QuizSession, SessionParticipant.session_id == QuizSession.id)
+                               .where(QuizSession.instructor_id == instructor_id)
+                               .scalar_subquery())
+        row = (self.db.query(
+                    func.count(QuizSession.id).label('total'),
+                    count_status(SessionStatus.ACTIVE).label('active'),
+                    count_status(SessionStatus.CLOSED).label('closed'),
+                    count_status(SessionStatus.PENDING).label('pending'),
+                    unique_participants.label('unique_participants'))
+               .filter(QuizSession.instructor_id == instructor_id)
+               .one())
+        return dict(row._mapping)
+    
     def get_active_sessions_with_details(self, instructor_id: Any) -> List[Dict[str, Any]]:
         """Get active sessions with participant counts and quiz details"""
+        # Populate session.quiz from the joined row instead of a lazy load per session
+        loader_options = [contains_eager(QuizSession.quiz)]
+        if DETECT_N_PLUS_ONE:
+            # Development only: raiseload sticks to the identity-mapped sessions,
+            # so later get_session() calls in the same request would raise too
+            loader_options.append(raiseload('*'))
+        
         results = self.db.query(
             QuizSession,
-            func.count(SessionParticipant.id).label('participant_count')
+            func.count(SessionParticipant.id).label('participant_count'),
+            Quiz.title
         ).join(
             Quiz,
             QuizSession.quiz_id == Quiz.id
+        ).options(
+            *loader_options
         ).outerjoin(
             SessionParticipant,
             QuizSession.id == SessionParticipant.session_id
@@ -194,8 +348,8 @@ class SessionDataAccess(BaseDataAccess):
             {
                 'session': session,
                 'participant_count': count,
-                'quiz_title': session.quiz.title
+                'quiz_title': title
             }
-            for session, count in results
+            for session, count, title in results
         ]
 
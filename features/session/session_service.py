@@ -2,7 +2,7 @@
 Session Service
 Business logic for quiz session and participant management
 """
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator
 from sqlalchemy.orm import Session
 from database.models.quiz_session import QuizSession
 from database.models.session_participiant import SessionParticipant
@@ -65,25 +65,14 @@ class SessionService:
             return {'success': False, 'message': 'Session not found'}
         
         # Import here to avoid circular dependency
-        from features.quiz import QuizDataAccess
-        quiz_data = QuizDataAccess(self.db)
-        
-        # Get first question (need quiz data access)
         from features.quiz import QuestionDataAccess
-        question_data = QuestionDataAccess(self.db)
-        questions = question_data.get_questions_by_quiz(session.quiz_id)
+        first_question = QuestionDataAccess(self.db).get_first_question(session.quiz_id)
         
-        if not questions:
+        if not first_question:
             return {'success': False, 'message': 'Quiz has no questions'}
         
-        # Update session status
-        self.session_data.update_status(session_id, SessionStatus.ACTIVE)
-        
-        # Set first question as current
-        self.session_data.update_current_question(session_id, questions[0].id)
-        
-        # Refresh session
-        self.db.refresh(session)
+        # Activate and set the first question in one statement
+        session = self.session_data.start_session_atomic(session_id, first_question.id)
         
         return {'success': True, 'session': session}
     
@@ -97,7 +86,7 @@ class SessionService:
         Returns:
             Updated QuizSession instance
         """
-        return self.session_data.update_status(session_id, SessionStatus.CLOSED)
+        return self.session_data.end_session_atomic(session_id)
     
     def next_question(self, session_id: Any) -> dict:
         """
@@ -114,26 +103,14 @@ class SessionService:
         if not session:
             return {'success': False, 'message': 'Session not found'}
         
-        # Get quiz questions
-        from features.quiz import QuestionDataAccess
-        question_data = QuestionDataAccess(self.db)
-        questions = question_data.get_questions_by_quiz(session.quiz_id)
-        
-        # Find current question index
-        current_idx = -1
-        if session.current_question_id:
-            for idx, q in enumerate(questions):
-                if q.id == session.current_question_id:
-                    current_idx = idx
-                    break
-        
-        # Check if there's a next question
-        next_idx = current_idx + 1
-        if next_idx >= len(questions):
+        # Advance and look up the next question in one statement
+        advanced = self.session_data.advance_question_atomic(session_id, session.current_question_id)
+        if not advanced:
             return {'success': False, 'message': 'No more questions'}
         
-        next_question = questions[next_idx]
-        self.session_data.update_current_question(session_id, next_question.id)
+        # Import here to avoid circular dependency
+        from features.quiz import QuestionDataAccess
+        next_question = QuestionDataAccess(self.db).get_question_by_id(advanced.current_question_id)
         
         return {'success': True, 'question': next_question}
     
@@ -197,6 +174,26 @@ class SessionService:
         """
         return self.session_data.get_recent_sessions(instructor_id, limit)
     
+    def get_instructor_session_summaries(
+        self,
+        instructor_id: Any,
+        status: Optional[SessionStatus] = None,
+        limit: Optional[int] = None
+    ) -> List[Any]:
+        """
+        Get column-only session rows for list views
+        
+        Args:
+            instructor_id: Instructor user ID
+            status: Optional status filter
+            limit: Optional maximum number of rows
+            
+        Returns:
+            Rows with id, session_code, status, start_time, end_time, created_at,
+            quiz_title and participant_count, newest first
+        """
+        return self.session_data.get_sessions_by_instructor_summary(instructor_id, status, limit)
+    
     # ==================== Participant Operations ====================
     
     def join_session(self, session_code: str, student_id: Any) -> dict:
@@ -210,21 +207,22 @@ class SessionService:
         Returns:
             Dictionary with 'success' boolean and 'message' or 'session'
         """
-        session = self.session_data.get_session_by_code(session_code)
+        # Route by the cached (id, status); the full row is only loaded on success
+        route = self.session_data.get_session_route_by_code(session_code)
         
-        if not session:
+        if not route:
             return {'success': False, 'message': 'Invalid session code'}
         
-        if session.status == SessionStatus.CLOSED:
+        session_id, status = route
+        if status == SessionStatus.CLOSED:
             return {'success': False, 'message': 'This session has ended'}
         
-        # Check if already a participant
-        if self.participant_data.is_participant(session.id, student_id):
+        # Add as participant; an existing participation is left untouched
+        _, created = self.participant_data.add_participant_idempotent(session_id, student_id)
+        session = self.session_data.get_session_by_id(session_id)
+        if not created:
             return {'success': True, 'message': 'Already joined', 'session': session}
         
-        # Add as participant
-        self.participant_data.add_participant(session.id, student_id)
-        
         return {'success': True, 'message': 'Joined successfully', 'session': session}
     
     def get_participants(self, session_id: Any) -> List[SessionParticipant]:
@@ -239,6 +237,22 @@ class SessionService:
         """
         return self.participant_data.get_participants_by_session(session_id)
     
+    def iter_participants(self, session_id: Any) -> Iterator[Any]:
+        """
+        Stream participants of a (possibly very large) session
+        
+        Args:
+            session_id: Session ID
+            
+        Returns:
+            Iterator of (student_id, joined_at) rows
+        """
+        return self.participant_data.iter_participants_by_session(session_id)
+    
+    def get_participant_count(self, session_id: Any) -> int:
+        """Count participants in a session"""
+        return self.participant_data.get_participant_count(session_id)
+    
     # ==================== Statistics Operations ====================
     
     def get_session_stats(self, instructor_id: Any) -> Dict[str, int]:
@@ -253,6 +267,18 @@ class SessionService:
         """
         return self.session_data.get_session_stats(instructor_id)
     
+    def get_dashboard_counters(self, instructor_id: Any) -> Dict[str, int]:
+        """
+        Get all session counters for the instructor dashboard in one query
+        
+        Args:
+            instructor_id: Instructor user ID
+            
+        Returns:
+            Dictionary with total, active, closed, pending and unique_participants
+        """
+        return self.session_data.get_dashboard_counters(instructor_id)
+    
     def get_active_sessions_count(self, instructor_id: Optional[Any] = None) -> int:
         """
         Get count of active sessions
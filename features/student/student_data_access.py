@@ -2,9 +2,9 @@
 Student/User Data Access Layer
 All database queries for user and student operations
 """
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import func, desc
+from sqlalchemy import func, select, bindparam, tuple_
 from database.models.user import User
 from database.models.session_participiant import SessionParticipant
 from database.models.student_ansawer import StudentAnswer
@@ -44,10 +44,7 @@ class StudentDataAccess(BaseDataAccess):
             password_hash=password_hash,
             role=role
         )
-        self.add(user)
-        self.commit()
-        self.refresh(user)
-        return user
+        return self.save(user)
     
     def get_user_by_id(self, user_id: Any) -> Optional[User]:
         """Get a user by ID"""
@@ -61,6 +58,12 @@ class StudentDataAccess(BaseDataAccess):
         """Get user by email"""
         return self.db.query(User).filter(User.email == email).first()
     
+    def update_password_hash(self, user: User, password_hash: str) -> User:
+        """Replace a user's stored password hash"""
+        user.password_hash = password_hash
+        self.commit()
+        return user
+    
     def delete_user(self, user_id: Any) -> bool:
         """Delete a user"""
         user = self.get_user_by_id(user_id)
@@ -74,18 +77,32 @@ class StudentDataAccess(BaseDataAccess):
     
     def username_exists(self, username: str) -> bool:
         """Check if username already exists"""
-        return self.get_user_by_username(username) is not None
+        return self.db.query(
+            self.db.query(User).filter(User.username == username).exists()
+        ).scalar()
     
     def email_exists(self, email: str) -> bool:
         """Check if email already exists"""
-        return self.get_user_by_email(email) is not None
+        return self.db.query(
+            self.db.query(User).filter(User.email == email).exists()
+        ).scalar()
+    
+    def username_email_taken(self, username: str, email: str) -> Tuple[bool, bool]:
+        """Check whether a username and an email are taken, in one round-trip"""
+        username_taken, email_taken = self.db.query(
+            self.db.query(User).filter(User.username == username).exists(),
+            self.db.query(User).filter(User.email == email).exists()
+        ).one()
+        return username_taken, email_taken
     
     # ==================== Student Query Operations ====================
     
     def get_students_by_ids(self, student_ids: List[Any]) -> List[User]:
-        """Get multiple students by their IDs"""
+        """Get multiple students by their IDs (one IN query, none for an empty list)"""
+        if not student_ids:
+            return []
         return (self.db.query(User)
-                .filter(User.id.in_(student_ids), User.role == UserRole.STUDENT)
+                .filter(User.id.in_(set(student_ids)), User.role == UserRole.STUDENT)
                 .all())
     
     def get_all_students(self) -> List[User]:
@@ -97,71 +114,84 @@ class StudentDataAccess(BaseDataAccess):
     
     # ==================== Student Statistics Operations ====================
     
-    def get_student_count(self, instructor_id: Optional[Any] = None) -> int:
-        """Get total count of students"""
-        query = (self.db.query(func.count(func.distinct(User.id)))
-                .filter(User.role == UserRole.STUDENT))
-        
-        if instructor_id:
-            query = (query.join(SessionParticipant, User.id == SessionParticipant.student_id)
-                    .join(QuizSession, SessionParticipant.session_id == QuizSession.id)
-                    .filter(QuizSession.instructor_id == instructor_id))
-        
-        return query.scalar() or 0
-    
     def get_all_students_with_stats(
         self,
         instructor_id: Optional[Any] = None,
         search: Optional[str] = None,
         limit: Optional[int] = None,
-        offset: int = 0
+        offset: int = 0,
+        after: Optional[Tuple[str, Any]] = None
     ) -> List[Dict[str, Any]]:
-        """Get all students with their participation statistics"""
+        """Get all students with their participation statistics (keyset on username, id)"""
+        # Aggregate participations and answers separately, one row per student each,
+        # instead of joining both tables and multiplying sessions by answers
+        participation_stats = (select(
+                SessionParticipant.student_id,
+                func.count(SessionParticipant.id).label('total_sessions'),
+                func.max(SessionParticipant.joined_at).label('last_active'),
+                # Denormalized per-session counters, so accuracy needs no answer scan
+                (100.0 * func.sum(SessionParticipant.correct_count)
+                    / func.nullif(func.sum(SessionParticipant.answered_count), 0)
+                 ).label('avg_score'))
+            .group_by(SessionParticipant.student_id))
+        answer_stats = (select(
+                StudentAnswer.student_id,
+                func.count(StudentAnswer.id).label('total_answers'))
+            .group_by(StudentAnswer.student_id))
+        
+        # Filter by instructor if provided
+        if instructor_id:
+            participation_stats = (participation_stats
+                .join(QuizSession, SessionParticipant.session_id == QuizSession.id)
+                .where(QuizSession.instructor_id == instructor_id))
+            answer_stats = (answer_stats
+                .join(QuizSession, StudentAnswer.session_id == QuizSession.id)
+                .where(QuizSession.instructor_id == instructor_id))
+        
+        participation_stats = participation_stats.subquery()
+        answer_stats = answer_stats.subquery()
+        
         # Build base query
         query = self.db.query(
             User.id,
             User.username,
             User.email,
             User.created_at,
-            func.count(func.distinct(SessionParticipant.session_id)).label('total_sessions'),
-            func.count(StudentAnswer.id).label('total_answers'),
-            func.max(SessionParticipant.joined_at).label('last_active')
+            participation_stats.c.total_sessions,
+            answer_stats.c.total_answers,
+            participation_stats.c.last_active,
+            participation_stats.c.avg_score
         ).filter(User.role == UserRole.STUDENT)
         
-        # Join with session participants
-        query = query.outerjoin(
-            SessionParticipant,
-            User.id == SessionParticipant.student_id
-        )
-        
-        # Join with student answers
-        query = query.outerjoin(
-            StudentAnswer,
-            User.id == StudentAnswer.student_id
-        )
-        
-        # Filter by instructor if provided
+        # Only students who joined the instructor's sessions when filtering by instructor
         if instructor_id:
-            query = (query.join(QuizSession, SessionParticipant.session_id == QuizSession.id)
-                    .filter(QuizSession.instructor_id == instructor_id))
+            query = query.join(participation_stats, User.id == participation_stats.c.student_id)
+        else:
+            query = query.outerjoin(participation_stats, User.id == participation_stats.c.student_id)
+        query = query.outerjoin(answer_stats, User.id == answer_stats.c.student_id)
         
-        # Search filter
+        # Search filter (blank input means no filter)
+        search = search.strip() if search else ''
         if search:
-            search_term = f"%{search}%"
+            # One named bind used by both columns keeps a single parameter slot
+            # and a compiled statement that is cached across search terms
+            search_term = bindparam('search_term')
             query = query.filter(
                 (User.username.ilike(search_term)) |
                 (User.email.ilike(search_term))
-            )
+            ).params(search_term=f"%{search}%")
         
-        # Group by user
-        query = query.group_by(User.id)
+        # Seek past the last row of the previous page instead of skipping rows
+        if after is not None:
+            query = query.filter(tuple_(User.username, User.id) > tuple_(*after))
         
-        # Order by last active (most recent first)
-        query = query.order_by(desc('last_active'))
+        query = query.order_by(User.username, User.id)
         
-        # Pagination
+        # Pagination (offset is only meant for the first page)
         if limit:
-            query = query.limit(limit).offset(offset)
+            query = query.limit(limit)
+            if after is None and offset:
+                query = query.offset(offset)
         
         results = query.all()
         
@@ -173,7 +203,8 @@ class StudentDataAccess(BaseDataAccess):
                 'created_at': r.created_at,
                 'total_sessions': r.total_sessions or 0,
                 'total_answers': r.total_answers or 0,
-                'last_active': r.last_active
+                'last_active': r.last_active,
+                'avg_score': float(r.avg_score or 0)
             }
             for r in results
         ]
@@ -2,11 +2,11 @@
 Student Service
 Business logic for student/user management operations
 """
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from sqlalchemy.orm import Session
 from database.models.user import User
 from database.enums import UserRole
-from shared.auth_helpers import hash_password, verify_password
+from shared.auth_helpers import hash_password, verify_login_password, needs_rehash
 from .student_data_access import StudentDataAccess
 
 
@@ -41,12 +41,13 @@ class StudentService:
         """
         user = self.data_access.get_user_by_username(username)
         
-        if not user:
+        # Verify password (also for unknown usernames, so timing does not reveal them)
+        if not verify_login_password(password, user.password_hash if user else None):
             return None
         
-        # Verify password
-        if not verify_password(password, user.password_hash):
-            return None
+        # Upgrade legacy hashes while the plain password is at hand
+        if needs_rehash(user.password_hash):
+            self.data_access.update_password_hash(user, hash_password(password))
         
         return user
     
@@ -82,15 +83,15 @@ class StudentService:
                 'message': 'Password must be at least 6 characters long'
             }
         
-        # Check if username exists
-        if self.data_access.username_exists(username):
+        # Check if username or email exists (one query for both)
+        username_taken, email_taken = self.data_access.username_email_taken(username, email)
+        if username_taken:
             return {
                 'success': False,
                 'message': 'Username already exists'
             }
         
-        # Check if email exists
-        if self.data_access.email_exists(email):
+        if email_taken:
             return {
                 'success': False,
                 'message': 'Email already exists'
@@ -154,24 +155,13 @@ class StudentService:
         """
         return self.data_access.get_students_by_ids(student_ids)
     
-    def get_student_count(self, instructor_id: Optional[Any] = None) -> int:
-        """
-        Get total count of students
-        
-        Args:
-            instructor_id: Optional filter by instructor's sessions
-            
-        Returns:
-            Total count of students
-        """
-        return self.data_access.get_student_count(instructor_id)
-    
     def get_all_students_with_stats(
         self,
         instructor_id: Optional[Any] = None,
         search: Optional[str] = None,
         limit: Optional[int] = None,
-        offset: int = 0
+        offset: int = 0,
+        after: Optional[Tuple[str, Any]] = None
     ) -> List[Dict[str, Any]]:
         """
         Get all students with their participation statistics
@@ -180,15 +170,17 @@ class StudentService:
             instructor_id: Optional filter by instructor's sessions
             search: Optional search by username or email
             limit: Optional limit number of results
-            offset: Offset for pagination
+            offset: Offset for pagination (first page only)
+            after: (username, id) of the last student on the previous page
             
         Returns:
-            List of dictionaries with student stats
+            List of dictionaries with student stats, ordered by username
         """
         return self.data_access.get_all_students_with_stats(
             instructor_id,
             search,
             limit,
-            offset
+            offset,
+            after
         )
 
@@ -2,29 +2,67 @@
 Logging Configuration
 Centralized logging setup for the application
 """
+import atexit
 import logging
+import os
+import queue
 import sys
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 from pathlib import Path
 
-# Create logs directory if it doesn't exist
-log_dir = Path("logs")
-log_dir.mkdir(exist_ok=True)
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        # Log to file
-        logging.FileHandler(log_dir / "app.log"),
-        # Log to console
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+# WARNING by default; set LOG_LEVEL=INFO (or DEBUG) in development
+LOG_LEVEL = os.getenv("LOG_LEVEL", "WARNING").upper()
 
 # Create logger
 logger = logging.getLogger("quiz_app")
 
+_configured = False
+
+
+def configure_logging():
+    """
+    Set up the log file, console output and level (once per process)
+    
+    Called from the app entry point, so importing modules that log has no
+    filesystem or thread side effects.
+    """
+    global _configured
+    if _configured:
+        return
+    _configured = True
+    
+    # Create logs directory if it doesn't exist
+    log_dir = Path("logs")
+    log_dir.mkdir(exist_ok=True)
+    
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    
+    # Log to file (rotated at 10 MB, 5 backups kept)
+    file_handler = RotatingFileHandler(
+        log_dir / "app.log", maxBytes=10_000_000, backupCount=5, encoding='utf-8'
+    )
+    # Log to console
+    console_handler = logging.StreamHandler(sys.stdout)
+    for handler in (file_handler, console_handler):
+        handler.setFormatter(formatter)
+    
+    # Callers only enqueue records; a background thread does the file and console writes
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    
+    queue_handler = QueueHandler(log_queue)
+    # Pass the bare message through; the listener's handlers apply the real format
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+    
+    # Configure logging
+    logging.basicConfig(
+        level=LOG_LEVEL,
+        handlers=[queue_handler]
+    )
+
+
 def get_logger(name: str):
     """
     Get a logger instance for a specific module
@@ -100,19 +100,19 @@ def verify_migration():
         for table in tables:
             print(f"   - {table}")
         
-        # Check if UUID columns exist
+        # Check if UUID columns exist (one query for all tables)
         print("\n   Checking UUID columns...")
+        result = conn.execute(text("""
+            SELECT table_name, data_type 
+            FROM information_schema.columns 
+            WHERE table_schema = 'public' 
+            AND column_name = 'id';
+        """))
+        id_types = dict(result.fetchall())
+        
         for table in tables:
-            result = conn.execute(text(f"""
-                SELECT column_name, data_type 
-                FROM information_schema.columns 
-                WHERE table_name = '{table}' 
-                AND column_name = 'id';
-            """))
-            
-            row = result.fetchone()
-            if row:
-                col_name, data_type = row
+            data_type = id_types.get(table)
+            if data_type:
                 if data_type == 'uuid':
                     print(f"   ✅ {table}.id is UUID")
                 else:
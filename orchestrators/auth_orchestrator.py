@@ -5,8 +5,18 @@ Following Streamlit best practices for auth flows
 import streamlit as st
 from database.enums import UserRole
 from features.student import StudentService
+from shared.auth_helpers import format_role_label
+from shared.notifications import notify
 from .base_orchestrator import BaseOrchestrator
 
+# Registration role choices, built once instead of on every rerun
+_ROLE_OPTIONS = (UserRole.STUDENT, UserRole.INSTRUCTOR)
+
+
+def _format_role_option(role: UserRole) -> str:
+    """Display label for a role in the registration form"""
+    return role.value.capitalize()
+
 
 class AuthOrchestrator(BaseOrchestrator):
     """
@@ -23,7 +33,7 @@ class AuthOrchestrator(BaseOrchestrator):
         """Initialize authentication service (private method)"""
         if self.auth_service is None:
             db = self._get_db()
-            self.auth_service = StudentService(db)
+            self.auth_service = self._get_services("auth", lambda: StudentService(db))
     
     def show_auth_page(self):
         """Display authentication page with login and registration tabs"""
@@ -69,8 +79,8 @@ class AuthOrchestrator(BaseOrchestrator):
             email = st.text_input("Email", key="register_email")
             password = st.text_input("Password", type="password", key="register_password")
             password_confirm = st.text_input("Confirm Password", type="password", key="register_password_confirm")
-            role = st.selectbox("Role", options=[UserRole.STUDENT, UserRole.INSTRUCTOR], 
-                               format_func=lambda x: x.value.capitalize())
+            role = st.selectbox("Role", options=_ROLE_OPTIONS,
+                               format_func=_format_role_option)
             
             submit = st.form_submit_button("Register", use_container_width=True)
             
@@ -89,6 +99,7 @@ class AuthOrchestrator(BaseOrchestrator):
                 st.session_state.user_id = str(user.id)
                 st.session_state.username = user.username
                 st.session_state.role = user.role
+                st.session_state.role_label = format_role_label(user.role)
                 st.session_state.authenticated = True
                 st.success(f"Welcome back, {user.username}!")
                 st.rerun()
@@ -121,12 +132,10 @@ class AuthOrchestrator(BaseOrchestrator):
             result = self.auth_service.register(username, email, password, role)
             
             if result['success']:
-                st.success("✅ Account created successfully! Redirecting to login...")
+                # Toast on the next run instead of holding this one open to show a banner
+                notify("Account created successfully! Please log in.", 'success')
                 # Clear form fields and redirect to login
                 st.session_state.auth_tab = 0
-                # Force a small delay to show success message
-                import time
-                time.sleep(1.5)
                 st.rerun()
             else:
                 st.error(result['message'])
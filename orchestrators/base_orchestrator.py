@@ -5,8 +5,13 @@ Following Streamlit best practices for modular architecture
 import streamlit as st
 from sqlalchemy.orm import Session
 from uuid import UUID
-from typing import Optional
-from database import SessionLocal
+from typing import Optional, Any, Callable
+from database.streamlit_session import (
+    get_request_session,
+    get_request_read_session,
+    get_request_scoped,
+    close_request_session
+)
 
 
 class BaseOrchestrator:
@@ -24,12 +29,36 @@ class BaseOrchestrator:
         Get database session (private method)
         
         Returns:
-            SQLAlchemy session
+            SQLAlchemy session shared across reruns of this browser session
         """
         if self.db is None:
-            self.db = SessionLocal()
+            self.db = get_request_session()
         return self.db
     
+    def _get_read_db(self) -> Session:
+        """
+        Get read-only database session (private method)
+        
+        Returns:
+            SQLAlchemy session on the read engine
+        """
+        return get_request_read_session()
+    
+    def _get_services(self, name: str, build: Callable[[], Any]) -> Any:
+        """
+        Get services built once per browser session (private method)
+        
+        Services only hold the request sessions, so they are reused across reruns.
+        
+        Args:
+            name: Cache slot name
+            build: Builds the services on first use
+            
+        Returns:
+            The cached services
+        """
+        return get_request_scoped(name, build)
+    
     def _get_user_uuid(self) -> Optional[UUID]:
         """
         Get current user's UUID from session state (private method)
@@ -63,9 +92,9 @@ class BaseOrchestrator:
         st.session_state.user_id = None
         st.session_state.username = None
         st.session_state.role = None
+        st.session_state.role_label = ''
         st.session_state.authenticated = False
-        if self.db:
-            self.db.close()
-            self.db = None
+        close_request_session()
+        self.db = None
         st.rerun()
 
@@ -10,12 +10,8 @@ from features.scoring import ScoringService
 from features.student import StudentService
 from .base_orchestrator import BaseOrchestrator
 
-# Import view modules
-from ui.instructor.dashboard import InstructorDashboardView
-from ui.instructor.quiz_management import QuizManagementView
-from ui.instructor.session_management import SessionManagementView
-from ui.instructor.results import ResultsView
-from ui.instructor.student_management import StudentManagementView
+# Note: Instructor views (pandas, qrcode) are imported on first use, not when
+# the orchestrators package is loaded for the auth or student pages
 
 
 class InstructorOrchestrator(BaseOrchestrator):
@@ -45,10 +41,23 @@ class InstructorOrchestrator(BaseOrchestrator):
         """Initialize all services with database session (lazy loading)"""
         if self.quiz_service is None:
             db = self._get_db()
-            self.quiz_service = QuizService(db)
-            self.session_service = SessionService(db)
-            self.scoring_service = ScoringService(db)
-            self.student_service = StudentService(db)
+            (self.quiz_service, self.session_service,
+             self.scoring_service, self.student_service) = self._get_services(
+                "instructor",
+                lambda: (
+                    QuizService(db, self._get_read_db()),
+                    SessionService(db),
+                    ScoringService(db),
+                    StudentService(db)
+                )
+            )
+            
+            # Import view modules
+            from ui.instructor.dashboard import InstructorDashboardView
+            from ui.instructor.quiz_management import QuizManagementView
+            from ui.instructor.session_management import SessionManagementView
+            from ui.instructor.results import ResultsView
+            from ui.instructor.student_management import StudentManagementView
             
             # Initialize views with services
             self.dashboard_view = InstructorDashboardView(
@@ -7,6 +7,7 @@ import streamlit as st
 from features.session import SessionService
 from features.quiz import QuizService
 from features.scoring import ScoringService
+from database.streamlit_session import close_request_session
 from .base_orchestrator import BaseOrchestrator
 
 # Note: Student views are modular and highly interactive
@@ -31,9 +32,14 @@ class StudentOrchestrator(BaseOrchestrator):
         """Initialize all services with database session (lazy loading)"""
         if self.session_service is None:
             db = self._get_db()
-            self.session_service = SessionService(db)
-            self.quiz_service = QuizService(db)
-            self.scoring_service = ScoringService(db)
+            self.session_service, self.quiz_service, self.scoring_service = self._get_services(
+                "student",
+                lambda: (
+                    SessionService(db),
+                    QuizService(db, self._get_read_db()),
+                    ScoringService(db)
+                )
+            )
     
     def show_dashboard(self):
         """Main student dashboard - routes to appropriate view"""
@@ -85,7 +91,8 @@ class StudentOrchestrator(BaseOrchestrator):
     
     def _handle_logout(self):
         """Handle user logout"""
+        close_request_session()
+        self.db = None
         # Clear all session state
-        for key in list(st.session_state.keys()):
-            del st.session_state[key]
+        st.session_state.clear()
 
@@ -1,7 +1,25 @@
 """
 Authentication helper functions
 """
+import time
+import hashlib
+import threading
 import bcrypt
+from functools import cache
+from typing import Optional
+from config import BCRYPT_ROUNDS, BCRYPT_PREHASH
+from database.enums import UserRole
+from logging_config import get_logger
+
+logger = get_logger("auth")
+
+# Marks hashes whose bcrypt input is the SHA-256 hex digest of the password
+_PREHASH_PREFIX = "sha256$"
+
+
+def _prehash(password: str) -> bytes:
+    """Reduce a password to a fixed 64-byte bcrypt input"""
+    return hashlib.sha256(password.encode('utf-8')).hexdigest().encode('ascii')
 
 
 def hash_password(password: str) -> str:
@@ -14,9 +32,10 @@ def hash_password(password: str) -> str:
     Returns:
         Hashed password string
     """
-    salt = bcrypt.gensalt()
-    hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
-    return hashed.decode('utf-8')
+    salt = bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
+    if BCRYPT_PREHASH:
+        return _PREHASH_PREFIX + bcrypt.hashpw(_prehash(password), salt).decode('utf-8')
+    return bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8')
 
 
 def verify_password(password: str, password_hash: str) -> bool:
@@ -30,8 +49,99 @@ def verify_password(password: str, password_hash: str) -> bool:
     Returns:
         True if password matches, False otherwise
     """
+    if password_hash.startswith(_PREHASH_PREFIX):
+        return bcrypt.checkpw(_prehash(password),
+                              password_hash[len(_PREHASH_PREFIX):].encode('utf-8'))
+    # Legacy hash of the raw password
     return bcrypt.checkpw(password.encode('utf-8'), password_hash.encode('utf-8'))
 
 
+@cache
+def _dummy_password_hash() -> str:
+    """Hash compared against when the user does not exist (built once, current scheme and cost)"""
+    return hash_password("dummy-password")
+
+
+def verify_login_password(password: str, password_hash: Optional[str]) -> bool:
+    """
+    Verify a login password, spending the same bcrypt time when the user is missing
+    
+    Prevents telling valid usernames apart by response time.
+    
+    Args:
+        password: Plain text password to verify
+        password_hash: Stored password hash, or None if no such user
+        
+    Returns:
+        True only if a hash was given and the password matches it
+    """
+    if password_hash is None:
+        verify_password(password, _dummy_password_hash())
+        return False
+    return verify_password(password, password_hash)
+
+
+def needs_rehash(password_hash: str) -> bool:
+    """
+    Check whether a stored hash uses an outdated scheme or cost
+    
+    Args:
+        password_hash: Stored password hash
+        
+    Returns:
+        True if the hash should be replaced after the next successful login
+    """
+    if password_hash.startswith(_PREHASH_PREFIX) != BCRYPT_PREHASH:
+        return True
+    # bcrypt hashes look like $2b$12$..., the third field is the cost
+    bcrypt_hash = password_hash[len(_PREHASH_PREFIX):] if BCRYPT_PREHASH else password_hash
+    try:
+        return int(bcrypt_hash.split('$')[2]) != BCRYPT_ROUNDS
+    except (IndexError, ValueError):
+        return True
+
+
+@cache
+def log_password_hash_cost() -> float:
+    """
+    Time one password hash at the configured cost and log it (once per process)
+    
+    Used to tune BCRYPT_ROUNDS for the deployment hardware.
+    
+    Returns:
+        Hash time in milliseconds
+    """
+    start = time.perf_counter()
+    # The timed hash is the dummy login hash, so it is built here as well
+    _dummy_password_hash()
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    logger.info(f"bcrypt cost {BCRYPT_ROUNDS}: {elapsed_ms:.0f} ms per password hash")
+    return elapsed_ms
+
+
+@cache
+def warm_up_password_hashing() -> None:
+    """
+    Measure the hash cost and build the dummy login hash in the background (once per process)
+    
+    Keeps both bcrypt runs off the first page render and the first failed login.
+    """
+    threading.Thread(target=log_password_hash_cost, name="bcrypt-warmup", daemon=True).start()
+
+
+@cache
+def format_role_label(role: UserRole) -> str:
+    """
+    Get the display label for a user role (computed once per role)
+    
+    Args:
+        role: User role
+        
+    Returns:
+        Upper-case role label, e.g. "INSTRUCTOR"
+    """
+    return role.value.upper()
+
+
 
 
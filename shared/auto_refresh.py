@@ -3,23 +3,29 @@ Auto-refresh utilities for real-time updates without manual page refreshes
 """
 import streamlit as st
 import time
-from typing import Optional
+from typing import Optional, Callable
+from database.streamlit_session import release_request_session
 
 
 def auto_refresh_component(
     interval_seconds: int = 5,
     key: str = "auto_refresh",
     label: str = "Auto-refreshing",
-    show_indicator: bool = True
+    show_indicator: bool = True,
+    live_region: Optional[Callable[[], None]] = None
 ):
     """
     Add auto-refresh functionality to the current page
     
+    With a live_region only that callable reruns on each tick (as a fragment);
+    without one the whole page reruns once per interval.
+    
     Args:
         interval_seconds: Refresh interval in seconds
         key: Unique key for this refresh component
         label: Label to show in indicator
         show_indicator: Whether to show refresh indicator
+        live_region: Renders the part of the page that needs live data
     """
     # Initialize refresh state
     if f'{key}_enabled' not in st.session_state:
@@ -60,15 +66,34 @@ def auto_refresh_component(
                 st.session_state[f'{key}_enabled'] = not st.session_state[f'{key}_enabled']
                 st.rerun()
     
-    # Trigger refresh if enabled
-    if st.session_state[f'{key}_enabled']:
-        current_time = time.time()
-        elapsed = current_time - st.session_state[f'{key}_last_refresh']
+    # Timer ticks come from the browser; paused pages render once without a timer.
+    # At least 1 second apart, so a zero interval cannot turn into a rerun loop
+    run_every = max(1, interval_seconds) if st.session_state[f'{key}_enabled'] else None
+    
+    if live_region is not None:
+        @st.fragment(run_every=run_every)
+        def live_fragment():
+            try:
+                live_region()
+            finally:
+                # Fragment reruns skip app.py's end-of-run cleanup
+                release_request_session()
         
-        if elapsed >= interval_seconds:
-            st.session_state[f'{key}_last_refresh'] = current_time
-            time.sleep(0.1)  # Small delay to prevent too rapid refreshes
+        live_fragment()
+        return
+    
+    # The first run belongs to this page run and only arms the timer;
+    # every later tick reruns the whole page
+    st.session_state[f'{key}_armed'] = False
+    
+    @st.fragment(run_every=run_every)
+    def page_timer():
+        if st.session_state[f'{key}_armed']:
+            st.session_state[f'{key}_last_refresh'] = time.time()
             st.rerun()
+        st.session_state[f'{key}_armed'] = True
+    
+    page_timer()
 
 
 def enable_auto_refresh(key: str = "auto_refresh"):
@@ -125,20 +150,20 @@ class RefreshManager:
         """Check if context should refresh"""
         key = f"refresh_manager_{context}"
         
-        if key not in st.session_state:
-            st.session_state[key] = {
-                'last_refresh': time.time(),
-                'enabled': True
-            }
+        # One session state lookup; the context dict is then updated in place
+        state = st.session_state.setdefault(key, {
+            'last_refresh': time.monotonic(),
+            'enabled': True
+        })
         
-        if not st.session_state[key]['enabled']:
+        if not state['enabled']:
             return False
         
         interval = self.contexts.get(context, self.default_interval)
-        elapsed = time.time() - st.session_state[key]['last_refresh']
+        now = time.monotonic()
         
-        if elapsed >= interval:
-            st.session_state[key]['last_refresh'] = time.time()
+        if now - state['last_refresh'] >= interval:
+            state['last_refresh'] = now
             return True
         
         return False
@@ -0,0 +1,118 @@
+"""
+Redis-backed memoization for hot aggregate queries
+Falls back to calling the database directly when REDIS_URL is unset,
+the redis package is missing, or Redis is unreachable
+"""
+import functools
+import json
+from typing import Any, Callable, Optional
+import config
+from logging_config import get_logger
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+logger = get_logger("cache")
+
+
+@functools.cache
+def get_redis() -> Optional["redis.Redis"]:
+    """
+    Get the shared Redis client
+    
+    Returns:
+        Redis client, or None if caching is disabled
+    """
+    if redis is None or not config.REDIS_URL:
+        return None
+    return redis.Redis.from_url(
+        config.REDIS_URL,
+        socket_timeout=0.1,
+        socket_connect_timeout=0.1
+    )
+
+
+def cache_get(key: str) -> Any:
+    """
+    Read a cached value
+    
+    Args:
+        key: Cache key
+    
+    Returns:
+        Cached value, or None on a miss or when caching is unavailable
+    """
+    client = get_redis()
+    if client is None:
+        return None
+    try:
+        hit = client.get(key)
+    except redis.RedisError as e:
+        logger.warning(f"Redis get failed for {key}: {e}")
+        return None
+    return json.loads(hit) if hit is not None else None
+
+
+def cache_set(key: str, ttl: int, value: Any) -> None:
+    """
+    Store a value in the cache
+    
+    Args:
+        key: Cache key
+        ttl: Cache lifetime in seconds
+        value: JSON-serializable value (stored as JSON, never pickled)
+    """
+    client = get_redis()
+    if client is None:
+        return
+    try:
+        client.setex(key, ttl, json.dumps(value))
+    except redis.RedisError as e:
+        logger.warning(f"Redis set failed for {key}: {e}")
+
+
+def cached(ttl: int, key: Callable[..., str]):
+    """
+    Memoize a result in Redis
+    
+    Args:
+        ttl: Cache lifetime in seconds
+        key: Function building the cache key from the call arguments
+    
+    Usage:
+        @cached(ttl=30, key=lambda self, instructor_id: f"quiz:count:{instructor_id}")
+        def get_quiz_count(self, instructor_id):
+            ...
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if get_redis() is None:
+                return func(*args, **kwargs)
+            
+            cache_key = key(*args, **kwargs)
+            result = cache_get(cache_key)
+            if result is None:
+                result = func(*args, **kwargs)
+                cache_set(cache_key, ttl, result)
+            return result
+        return wrapper
+    return decorator
+
+
+def invalidate(*keys: str) -> None:
+    """
+    Drop cached entries after a write
+    
+    Args:
+        keys: Cache keys to delete
+    """
+    client = get_redis()
+    if client is None or not keys:
+        return
+    try:
+        client.delete(*keys)
+    except redis.RedisError as e:
+        logger.warning(f"Redis delete failed for {keys}: {e}")
@@ -4,9 +4,11 @@ Following Streamlit best practices for optimal performance
 """
 import streamlit as st
 import functools
+import itertools
 import time
+from collections import deque
 from typing import Callable, Any, Optional
-from datetime import datetime
+from config import PERF_MONITOR_ENABLED, PERF_MONITOR_SAMPLE_RATE
 
 
 def cache_with_ttl(ttl_seconds: int = 300, key_prefix: str = ""):
@@ -23,12 +25,8 @@ def cache_with_ttl(ttl_seconds: int = 300, key_prefix: str = ""):
             return database.query(user_id)
     """
     def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            # Use Streamlit's built-in caching with TTL
-            cached_func = st.cache_data(ttl=ttl_seconds, show_spinner=False)(func)
-            return cached_func(*args, **kwargs)
-        return wrapper
+        # Use Streamlit's built-in caching with TTL (wrapped once, at decoration time)
+        return st.cache_data(ttl=ttl_seconds, show_spinner=False)(func)
     return decorator
 
 
@@ -75,6 +73,9 @@ def performance_monitor(threshold_ms: float = 1000.0, show_warning: bool = False
     """
     Monitor function performance and log slow operations
     
+    Only active with PERF_MONITOR set; otherwise the function is returned
+    undecorated. Slow calls are always recorded, others 1 in PERF_MONITOR_SAMPLE_RATE.
+    
     Args:
         threshold_ms: Warning threshold in milliseconds
         show_warning: Whether to show warning to user for slow operations
@@ -85,35 +86,44 @@ def performance_monitor(threshold_ms: float = 1000.0, show_warning: bool = False
             # Automatically monitored
             return process(data)
     """
+    threshold_ns = int(threshold_ms * 1e6)
+    sample_rate = max(1, PERF_MONITOR_SAMPLE_RATE)
+    
     def decorator(func: Callable) -> Callable:
+        if not PERF_MONITOR_ENABLED:
+            return func
+        
+        call_count = itertools.count(1)
+        
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
             result = func(*args, **kwargs)
-            elapsed_ms = (time.time() - start_time) * 1000
+            elapsed_ns = time.perf_counter_ns() - start_ns
             
-            if elapsed_ms > threshold_ms:
-                message = f"⚠️ Slow operation: {func.__name__} took {elapsed_ms:.2f}ms"
+            slow = elapsed_ns > threshold_ns
+            if slow:
+                message = f"⚠️ Slow operation: {func.__name__} took {elapsed_ns / 1e6:.2f}ms"
                 print(message)
                 
                 if show_warning:
                     st.warning(message, icon="⏱️")
+            elif next(call_count) % sample_rate:
+                # Fast call outside the sample: skip the session state write
+                return result
             
-            # Store performance metrics in session state
+            # Store performance metrics in session state (only the last 100 are kept)
             if 'performance_metrics' not in st.session_state:
-                st.session_state.performance_metrics = []
+                st.session_state.performance_metrics = deque(maxlen=100)
             
+            # Raw integer nanoseconds; convert to ms / datetime when displaying
             st.session_state.performance_metrics.append({
                 'function': func.__name__,
-                'elapsed_ms': elapsed_ms,
-                'timestamp': datetime.now(),
-                'slow': elapsed_ms > threshold_ms
+                'elapsed_ns': elapsed_ns,
+                'ts_ns': time.time_ns(),
+                'slow': slow
             })
             
-            # Keep only last 100 metrics
-            if len(st.session_state.performance_metrics) > 100:
-                st.session_state.performance_metrics = st.session_state.performance_metrics[-100:]
-            
             return result
         return wrapper
     return decorator
@@ -163,21 +173,32 @@ def memoize_in_session(key_prefix: str = "memoize"):
         @memoize_in_session(key_prefix="user_data")
         def get_user_data(user_id):
             return expensive_query(user_id)
+        
+        get_user_data.clear_cache()  # invalidate this session's results
     """
     def decorator(func: Callable) -> Callable:
+        # One dict per function; entries are keyed by the argument tuple
+        store_key = f"__memo__{key_prefix}_{func.__name__}"
+        
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            # Create cache key from function name and args
-            cache_key = f"{key_prefix}_{func.__name__}_{str(args)}_{str(kwargs)}"
+            cache_key = (args, tuple(sorted(kwargs.items()))) if kwargs else args
+            try:
+                hash(cache_key)
+            except TypeError:
+                # Unhashable arguments (lists, dicts) are not cached
+                return func(*args, **kwargs)
             
-            # Check if result is in session state
-            if cache_key in st.session_state:
-                return st.session_state[cache_key]
+            cache = st.session_state.setdefault(store_key, {})
+            if cache_key in cache:
+                return cache[cache_key]
             
             # Compute and cache result
             result = func(*args, **kwargs)
-            st.session_state[cache_key] = result
+            cache[cache_key] = result
             return result
+        
+        wrapper.clear_cache = lambda: st.session_state.pop(store_key, None)
         return wrapper
     return decorator
 
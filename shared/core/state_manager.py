@@ -76,8 +76,7 @@ class StateManager:
         """
         if keys is None:
             # Clear all
-            for key in list(st.session_state.keys()):
-                del st.session_state[key]
+            st.session_state.clear()
         else:
             # Clear specific keys
             for key in keys:
@@ -230,6 +229,8 @@ class NamespacedState:
             namespace: Namespace prefix for all keys
         """
         self.namespace = namespace
+        # Keys set through this namespace, so clear/get_all skip unrelated state
+        self._index_key = f"__ns_index__{namespace}"
     
     def _key(self, key: str) -> str:
         """Generate namespaced key"""
@@ -242,28 +243,36 @@ class NamespacedState:
     def set(self, key: str, value: Any) -> None:
         """Set value in namespaced state"""
         StateManager.set(self._key(key), value)
+        st.session_state.setdefault(self._index_key, set()).add(key)
     
     def delete(self, key: str) -> bool:
         """Delete key from namespaced state"""
+        st.session_state.get(self._index_key, set()).discard(key)
         return StateManager.delete(self._key(key))
     
     def exists(self, key: str) -> bool:
         """Check if key exists in namespaced state"""
         return StateManager.exists(self._key(key))
     
+    def _scan_keys(self) -> List[str]:
+        """Find this namespace's keys by prefix (for state written before the index)"""
+        prefix = f"{self.namespace}."
+        return [k[len(prefix):] for k in StateManager.keys() if k.startswith(prefix)]
+    
     def clear(self) -> None:
         """Clear all keys in this namespace"""
-        prefix = f"{self.namespace}."
-        keys_to_delete = [k for k in StateManager.keys() if k.startswith(prefix)]
-        StateManager.clear(keys_to_delete)
+        index = st.session_state.pop(self._index_key, None)
+        keys = index if index is not None else self._scan_keys()
+        StateManager.clear([self._key(k) for k in keys])
     
     def get_all(self) -> Dict[str, Any]:
         """Get all values in this namespace"""
-        prefix = f"{self.namespace}."
+        index = st.session_state.get(self._index_key)
+        keys = index if index is not None else self._scan_keys()
         return {
-            k.replace(prefix, ''): v
-            for k, v in StateManager.get_all().items()
-            if k.startswith(prefix)
+            k: st.session_state[self._key(k)]
+            for k in keys
+            if self._key(k) in st.session_state
         }
 
 
@@ -0,0 +1,34 @@
+"""
+Role-based page dispatch
+Lives outside app.py so the resolved page callables survive Streamlit reruns
+"""
+import functools
+import importlib
+from typing import Callable, Optional
+from database.enums import UserRole
+
+
+@functools.cache
+def _lazy(module_name: str, attr: str) -> Callable[[], None]:
+    """Import a page module on first use and cache its entry point"""
+    return getattr(importlib.import_module(module_name), attr)
+
+
+_PAGE_LOADERS = {
+    UserRole.INSTRUCTOR: lambda: _lazy("pages.instructor_dashboard", "show_instructor_dashboard"),
+    UserRole.STUDENT: lambda: _lazy("pages.student_dashboard", "show_student_dashboard"),
+}
+
+
+def get_page_for_role(role: Optional[UserRole]) -> Optional[Callable[[], None]]:
+    """
+    Get the dashboard entry point for a user role
+    
+    Args:
+        role: User role (may be None)
+        
+    Returns:
+        Page render function, or None if the role is unknown
+    """
+    loader = _PAGE_LOADERS.get(role)
+    return loader() if loader else None
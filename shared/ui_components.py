@@ -307,8 +307,8 @@ def format_datetime(dt: datetime, format: str = "relative") -> str:
         Formatted datetime string
     """
     if format == "relative":
-        from datetime import datetime, timedelta
-        now = datetime.utcnow()
+        from datetime import datetime, timedelta, timezone
+        now = datetime.now(timezone.utc)
         diff = now - dt
         
         if diff < timedelta(minutes=1):
@@ -45,8 +45,8 @@ class InstructorDashboardView:
         try:
             # Get statistics using services
             quiz_stats = self.quiz_service.get_quiz_stats(instructor_id)
-            session_stats = self.session_service.get_session_stats(instructor_id)
-            total_students = self.student_service.get_student_count(instructor_id)
+            session_stats = self.session_service.get_dashboard_counters(instructor_id)
+            total_students = session_stats['unique_participants']
             active_sessions_count = session_stats.get('active', 0)
             
             # Metrics Row
@@ -105,13 +105,10 @@ class InstructorDashboardView:
         st.markdown("### 📈 Recent Activity")
         
         # Get recent sessions
-        recent_sessions = self.session_service.get_recent_sessions(instructor_id, limit=5)
+        recent_sessions = self.session_service.get_instructor_session_summaries(instructor_id, limit=5)
         
         if recent_sessions:
             for session in recent_sessions:
-                # Get participant count
-                participants = self.session_service.get_participants(session.id)
-                
                 # Status badge
                 if session.status.value == 'active':
                     status_badge = f"<span style='background: {COLORS['success_light']}; color: {COLORS['success']}; padding: 0.25rem 0.75rem; border-radius: 12px; font-size: 0.75rem; font-weight: 600;'>● LIVE</span>"
@@ -128,12 +125,12 @@ class InstructorDashboardView:
                     f"""
                     <div style="background: white; padding: 1rem; margin: 0.5rem 0; border-radius: 8px; border-left: 4px solid {COLORS['primary']}; box-shadow: 0 1px 3px rgba(0,0,0,0.05);">
                         <div style="display: flex; justify-content: space-between; align-items: start; margin-bottom: 0.5rem;">
-                            <strong style="color: {COLORS['text_primary']}; font-size: 1rem;">{session.quiz.title}</strong>
+                            <strong style="color: {COLORS['text_primary']}; font-size: 1rem;">{session.quiz_title}</strong>
                             {status_badge}
                         </div>
                         <div style="color: {COLORS['text_secondary']}; font-size: 0.875rem;">
                             <span>🎯 Code: <strong>{session.session_code}</strong></span> &nbsp;&nbsp;
-                            <span>👥 {len(participants)} participants</span> &nbsp;&nbsp;
+                            <span>👥 {session.participant_count} participants</span> &nbsp;&nbsp;
                             <span>🕒 {time_str}</span>
                         </div>
                     </div>
@@ -148,54 +145,57 @@ class InstructorDashboardView:
         st.markdown("### 🎮 Active Sessions")
         
         if active_sessions_count > 0:
-            # Enable auto-refresh for active sessions
+            # Enable auto-refresh for active sessions (only the list reruns)
             auto_refresh_component(
                 interval_seconds=config.AUTO_REFRESH_ACTIVE_SESSION,
                 key="dashboard_active_sessions_refresh",
-                label="Auto-refreshing active sessions"
+                label="Auto-refreshing active sessions",
+                live_region=lambda: self._render_active_sessions_list(instructor_id)
             )
-            
-            active_sessions = self.session_service.get_active_sessions_with_details(instructor_id)
-            
-            for session_info in active_sessions:
-                session = session_info['session']
-                stats = session_info['stats']
-                
-                # Calculate completion
-                total_possible = stats['participant_count'] * stats['question_count']
-                completion = (stats['total_answers'] / total_possible * 100) if total_possible > 0 else 0
-                
-                st.markdown(
-                    f"""
-                    <div style="background: linear-gradient(135deg, {COLORS['primary']} 0%, {COLORS['primary_dark']} 100%); padding: 1.25rem; margin: 0.75rem 0; border-radius: 10px; color: white; box-shadow: 0 4px 12px rgba(37, 99, 235, 0.2);">
-                        <div style="font-size: 1.1rem; font-weight: 600; margin-bottom: 0.75rem;">
-                            {session.quiz.title}
-                        </div>
-                        <div style="background: rgba(255,255,255,0.15); padding: 0.5rem 0.75rem; border-radius: 6px; margin-bottom: 0.5rem;">
-                            <span style="font-size: 0.75rem; opacity: 0.9;">Session Code</span><br/>
-                            <span style="font-size: 1.25rem; font-weight: 700; font-family: monospace;">{session.session_code}</span>
-                        </div>
-                        <div style="font-size: 0.85rem; opacity: 0.95;">
-                            👥 {stats['participant_count']} students &nbsp;•&nbsp; 
-                            📝 {stats['total_answers']}/{total_possible} answers &nbsp;•&nbsp; 
-                            ✅ {completion:.0f}% complete
-                        </div>
-                    </div>
-                    """,
-                    unsafe_allow_html=True
-                )
-                
-                # Quick action button
-                if st.button(
-                    f"📊 Monitor {session.session_code}",
-                    key=f"monitor_{session.id}",
-                    use_container_width=True
-                ):
-                    st.session_state.active_session_id = session.id
-                    st.session_state.instructor_page = "Active Session"
-                    st.rerun()
         else:
             ui.info_card(
                 "No Active Sessions",
                 "Start a quiz session to see live updates here!"
             )
+    
+    def _render_active_sessions_list(self, instructor_id):
+        """Render one card per active session (refreshed live)"""
+        active_sessions = self.session_service.get_active_sessions_with_details(instructor_id)
+        
+        for session_info in active_sessions:
+            session = session_info['session']
+            stats = session_info['stats']
+            
+            # Calculate completion
+            total_possible = stats['participant_count'] * stats['question_count']
+            completion = (stats['total_answers'] / total_possible * 100) if total_possible > 0 else 0
+            
+            st.markdown(
+                f"""
+                <div style="background: linear-gradient(135deg, {COLORS['primary']} 0%, {COLORS['primary_dark']} 100%); padding: 1.25rem; margin: 0.75rem 0; border-radius: 10px; color: white; box-shadow: 0 4px 12px rgba(37, 99, 235, 0.2);">
+                    <div style="font-size: 1.1rem; font-weight: 600; margin-bottom: 0.75rem;">
+                        {session.quiz.title}
+                    </div>
+                    <div style="background: rgba(255,255,255,0.15); padding: 0.5rem 0.75rem; border-radius: 6px; margin-bottom: 0.5rem;">
+                        <span style="font-size: 0.75rem; opacity: 0.9;">Session Code</span><br/>
+                        <span style="font-size: 1.25rem; font-weight: 700; font-family: monospace;">{session.session_code}</span>
+                    </div>
+                    <div style="font-size: 0.85rem; opacity: 0.95;">
+                        👥 {stats['participant_count']} students &nbsp;•&nbsp; 
+                        📝 {stats['total_answers']}/{total_possible} answers &nbsp;•&nbsp; 
+                        ✅ {completion:.0f}% complete
+                    </div>
+                </div>
+                """,
+                unsafe_allow_html=True
+            )
+            
+            # Quick action button
+            if st.button(
+                f"📊 Monitor {session.session_code}",
+                key=f"monitor_{session.id}",
+                use_container_width=True
+            ):
+                st.session_state.active_session_id = session.id
+                st.session_state.instructor_page = "Active Session"
+                st.rerun()
@@ -6,6 +6,7 @@ import streamlit as st
 from shared import ui_components as ui
 from shared.styles import COLORS
 from logging_config import get_logger
+from config import QUIZZES_PER_PAGE
 
 logger = get_logger("quiz_management")
 
@@ -63,7 +64,9 @@ class QuizManagementView:
                 st.divider()
             
             # Load and display quizzes
-            quizzes = self.quiz_service.get_instructor_quizzes(instructor_id)
+            quiz_limit = st.session_state.get('quiz_list_limit', QUIZZES_PER_PAGE)
+            quizzes = self.quiz_service.get_instructor_quizzes(instructor_id, limit=quiz_limit)
+            has_more = len(quizzes) == quiz_limit
             
             if not quizzes:
                 ui.info_card(
@@ -82,7 +85,8 @@ class QuizManagementView:
             if sort_by == "Alphabetical":
                 quizzes.sort(key=lambda x: x.title.lower())
             elif sort_by == "Most Questions":
-                quiz_question_counts = {q.id: len(self.quiz_service.get_quiz_questions(q.id)) for q in quizzes}
+                from features.quiz.cached_reads import cached_questions_by_quiz
+                quiz_question_counts = {q.id: len(cached_questions_by_quiz(q.id)) for q in quizzes}
                 quizzes.sort(key=lambda x: quiz_question_counts.get(x.id, 0), reverse=True)
             
             st.markdown(f"### 📚 Your Quizzes ({len(quizzes)})")
@@ -90,6 +94,10 @@ class QuizManagementView:
             # Display quizzes
             for quiz in quizzes:
                 self._render_quiz_card(quiz, instructor_id)
+            
+            if has_more and st.button("Load more quizzes", key="load_more_quizzes"):
+                st.session_state.quiz_list_limit = quiz_limit + QUIZZES_PER_PAGE
+                st.rerun()
         
         except Exception as e:
             logger.error(f"Error loading quizzes for instructor {instructor_id}: {e}", exc_info=True)
@@ -197,7 +205,7 @@ class QuizManagementView:
                         # Create session and navigate
                         try:
                             from features.session import SessionService
-                            from database import get_db
+                            from database.streamlit_session import get_request_session
                             
                             # Validate quiz has questions
                             questions = self.quiz_service.get_quiz_questions(quiz.id)
@@ -207,7 +215,7 @@ class QuizManagementView:
                             
                             # Create session
                             st.info("Creating session...")
-                            session_service = SessionService(get_db())
+                            session_service = SessionService(get_request_session())
                             session = session_service.create_session(quiz.id, instructor_id)
                             
                             if session:
@@ -33,7 +33,7 @@ class ResultsView:
         st.title("📊 Results Dashboard")
         
         try:
-            sessions = self.session_service.get_instructor_sessions(
+            sessions = self.session_service.get_instructor_session_summaries(
                 instructor_id,
                 SessionStatus.CLOSED
             )
@@ -47,7 +47,7 @@ class ResultsView:
             
             # Session selector
             session_options = {
-                f"{s.quiz.title} - Code: {s.session_code} ({s.end_time.strftime('%Y-%m-%d %H:%M')})": s.id 
+                f"{s.quiz_title} - Code: {s.session_code} ({s.end_time.strftime('%Y-%m-%d %H:%M')})": s.id 
                 for s in sessions
             }
             
@@ -84,12 +84,9 @@ class ResultsView:
         """Render session summary with key metrics"""
         st.markdown("### 📋 Session Summary")
         
-        participants = self.session_service.get_participants(session.id)
-        all_answers = self.scoring_service.get_answers_by_session(session.id)
-        
-        # Calculate statistics
-        total_participants = len(participants)
-        total_answers = len(all_answers)
+        # Only counts are shown, so no participant or answer rows are loaded
+        total_participants = self.session_service.get_participant_count(session.id)
+        total_answers = self.scoring_service.count_session_answers(session.id)
         
         if session.start_time and session.end_time:
             duration = session.end_time - session.start_time
@@ -5,8 +5,9 @@ Handles active session monitoring and control
 import streamlit as st
 import qrcode
 from io import BytesIO
-from datetime import datetime
+from datetime import datetime, timezone
 from database.models import SessionStatus
+from features.quiz.cached_reads import cached_questions_by_quiz, cached_options_by_question
 from shared import ui_components as ui
 from shared.auto_refresh import auto_refresh_component
 from shared.notifications import log_activity
@@ -51,13 +52,6 @@ class SessionManagementView:
                 )
                 return
         
-            # Enable auto-refresh for active sessions
-            auto_refresh_component(
-                interval_seconds=config.AUTO_REFRESH_ACTIVE_SESSION,
-                key="active_session_refresh",
-                label="Live session monitoring"
-            )
-            
             # If multiple active sessions, show selector
             if len(active_sessions) > 1:
                 session = self._handle_multiple_sessions(active_sessions)
@@ -74,8 +68,13 @@ class SessionManagementView:
                 st.rerun()
                 return
             
-            # Display session monitoring interface
-            self._render_session_monitor(session, instructor_id)
+            # Display session monitoring interface (only the monitor reruns on refresh)
+            auto_refresh_component(
+                interval_seconds=config.AUTO_REFRESH_ACTIVE_SESSION,
+                key="active_session_refresh",
+                label="Live session monitoring",
+                live_region=lambda: self._render_session_monitor(session, instructor_id)
+            )
         
         except Exception as e:
             st.error(f"Error in active session: {e}")
@@ -127,7 +126,7 @@ class SessionManagementView:
         # Fetch fresh data
         self.db.expire_all()
         participants = self.session_service.get_participants(session.id)
-        questions = self.quiz_service.get_quiz_questions(session.quiz_id)
+        questions = cached_questions_by_quiz(session.quiz_id)
         all_answers = self.scoring_service.get_answers_by_session(session.id)
         
         # Calculate completion statistics
@@ -217,7 +216,7 @@ class SessionManagementView:
         with cols[3]:
             # Calculate time elapsed
             if session.start_time:
-                elapsed = datetime.utcnow() - session.start_time
+                elapsed = datetime.now(timezone.utc) - session.start_time
                 minutes = int(elapsed.total_seconds() // 60)
                 ui.metric_card(
                     label="Time Elapsed",
@@ -293,9 +292,11 @@ class SessionManagementView:
         st.subheader("Quiz Questions")
         
         current_q_index = 0
-        if session.current_question_id:
+        if session.current_question_index is not None:
+            current_q_index = session.current_question_index
+        elif session.current_question_id:
             for idx, q in enumerate(questions):
-                if q.id == session.current_question_id:
+                if q['id'] == session.current_question_id:
                     current_q_index = idx
                     break
         
@@ -304,18 +305,19 @@ class SessionManagementView:
             current_q = questions[current_q_index]
             
             st.markdown(f"### Question {current_q_index + 1}/{len(questions)}")
-            st.write(f"**{current_q.question_text}**")
+            st.write(f"**{current_q['question_text']}**")
             
-            for opt in current_q.options:
-                st.write(f"{chr(64 + opt.option_order)}. {opt.option_text}")
+            options = cached_options_by_question(current_q['id'])
+            for opt in options:
+                st.write(f"{chr(64 + opt['option_order'])}. {opt['option_text']}")
             
             col1, col2, col3 = st.columns(3)
             
             with col1:
                 if st.button("Show Answer", use_container_width=True):
-                    for opt in current_q.options:
-                        if opt.is_correct:
-                            st.success(f"Correct Answer: {chr(64 + opt.option_order)}")
+                    for opt in options:
+                        if opt['is_correct']:
+                            st.success(f"Correct Answer: {chr(64 + opt['option_order'])}")
             
             with col2:
                 if current_q_index < len(questions) - 1:
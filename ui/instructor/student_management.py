@@ -4,7 +4,7 @@ View and manage students with statistics
 """
 import streamlit as st
 import pandas as pd
-from datetime import datetime
+from datetime import datetime, timezone
 from shared import ui_components as ui
 from shared.styles import COLORS
 
@@ -84,7 +84,7 @@ class StudentManagementView:
             if sort_by == "Name":
                 students = sorted(students, key=lambda x: x['username'])
             elif sort_by == "Last Active":
-                students = sorted(students, key=lambda x: x['last_active'] or datetime.min, reverse=True)
+                students = sorted(students, key=lambda x: x['last_active'] or datetime.min.replace(tzinfo=timezone.utc), reverse=True)
             elif sort_by == "Total Sessions":
                 students = sorted(students, key=lambda x: x['total_sessions'], reverse=True)
             
@@ -4,6 +4,7 @@ Handles active quiz participation for students
 """
 import streamlit as st
 from database.models import SessionStatus
+from features.quiz.cached_reads import cached_questions_by_quiz, cached_options_by_question
 from shared.auto_refresh import auto_refresh_component
 from shared.styles import COLORS
 import config
@@ -63,8 +64,8 @@ class QuizParticipationView:
             # Render header
             self._render_session_header(session)
             
-            # Get questions
-            questions = self.quiz_service.get_quiz_questions(session.quiz_id)
+            # Get questions (cached across the auto-refresh reruns)
+            questions = cached_questions_by_quiz(session.quiz_id)
             
             if not questions:
                 st.error("No questions found in this quiz")
@@ -198,7 +199,7 @@ class QuizParticipationView:
                     font-weight: 700;
                     box-shadow: 0 4px 15px rgba(37, 99, 235, 0.2);
                 ">
-                    Question {question.question_order} of {len(all_questions)}
+                    Question {question['question_order']} of {len(all_questions)}
                 </div>
             </div>
             """,
@@ -207,7 +208,7 @@ class QuizParticipationView:
         
         # Check if already answered
         existing_answer = next((a for a in self.scoring_service.get_student_answers(session.id, student_id) 
-                               if a.question_id == question.id), None)
+                               if a.question_id == question['id']), None)
         
         # Constrained width for question
         col_left, col_center, col_right = st.columns([0.5, 4, 0.5])
@@ -226,7 +227,7 @@ class QuizParticipationView:
                 ">
                     <div style="display: flex; justify-content: space-between; align-items: start;">
                         <h3 style="color: {COLORS['text_primary']}; font-size: 1.15rem; margin: 0; font-weight: 600; flex: 1;">
-                            {question.question_text}
+                            {question['question_text']}
                         </h3>
                         <span style="
                             background: {COLORS['accent_light']};
@@ -237,7 +238,7 @@ class QuizParticipationView:
                             font-weight: 600;
                             white-space: nowrap;
                         ">
-                            ⏱️ {question.time_limit}s
+                            ⏱️ {question['time_limit']}s
                         </span>
                     </div>
                 </div>
@@ -246,7 +247,7 @@ class QuizParticipationView:
             )
             
             # Options
-            options = sorted(question.options, key=lambda x: x.option_order)
+            options = cached_options_by_question(question['id'])
             
             if existing_answer:
                 # Show answered options (read-only)
@@ -265,21 +266,21 @@ class QuizParticipationView:
             col1, col2 = st.columns(2)
             
             option = options[i]
-            is_selected = option.id == existing_answer.option_id
+            is_selected = option['id'] == existing_answer.option_id
             
             with col1:
                 self._render_option_display(option, is_selected)
             
             if i + 1 < len(options):
                 option = options[i + 1]
-                is_selected = option.id == existing_answer.option_id
+                is_selected = option['id'] == existing_answer.option_id
                 
                 with col2:
                     self._render_option_display(option, is_selected)
     
     def _render_option_display(self, option, is_selected):
         """Render a single option in display mode"""
-        option_letter = chr(64 + option.option_order)
+        option_letter = chr(64 + option['option_order'])
         
         st.markdown(
             f"""
@@ -306,7 +307,7 @@ class QuizParticipationView:
                     margin-right: 0.65rem;
                 ">{option_letter}</span>
                 <span style="font-size: 0.95rem; font-weight: {'600' if is_selected else '500'};">
-                    {option.option_text} {'✓' if is_selected else ''}
+                    {option['option_text']} {'✓' if is_selected else ''}
                 </span>
             </div>
             """,
@@ -342,30 +343,30 @@ class QuizParticipationView:
             col1, col2 = st.columns(2)
             
             option = options[i]
-            option_letter = chr(64 + option.option_order)
+            option_letter = chr(64 + option['option_order'])
             
             with col1:
                 st.markdown('<div class="compact-option">', unsafe_allow_html=True)
                 if st.button(
-                    f"**{option_letter}**  {option.option_text}",
-                    key=f"option_{option.id}_{question.id}",
+                    f"**{option_letter}**  {option['option_text']}",
+                    key=f"option_{option['id']}_{question['id']}",
                     use_container_width=True
                 ):
-                    self._submit_answer(session.id, question.id, option.id, student_id, all_questions, current_index)
+                    self._submit_answer(session.id, question['id'], option['id'], student_id, all_questions, current_index)
                 st.markdown('</div>', unsafe_allow_html=True)
             
             if i + 1 < len(options):
                 option = options[i + 1]
-                option_letter = chr(64 + option.option_order)
+                option_letter = chr(64 + option['option_order'])
                 
                 with col2:
                     st.markdown('<div class="compact-option">', unsafe_allow_html=True)
                     if st.button(
-                        f"**{option_letter}**  {option.option_text}",
-                        key=f"option_{option.id}_{question.id}",
+                        f"**{option_letter}**  {option['option_text']}",
+                        key=f"option_{option['id']}_{question['id']}",
                         use_container_width=True
                     ):
-                        self._submit_answer(session.id, question.id, option.id, student_id, all_questions, current_index)
+                        self._submit_answer(session.id, question['id'], option['id'], student_id, all_questions, current_index)
                     st.markdown('</div>', unsafe_allow_html=True)
     
     def _render_navigation(self, current_index, total_questions, answered_ids):